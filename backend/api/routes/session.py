@@ -3,6 +3,7 @@ Session API Routes
 Endpoints for session initialization, phase submission.
 """
 
+import logging
 import random
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone, timedelta
@@ -28,6 +29,8 @@ from backend.services.ai import evaluate_phase_async
 from backend.services.ai.evaluator_streaming import evaluate_phase_streaming
 from backend.utils.broadcast import get_broadcast_message
 
+logger = logging.getLogger("pitchsync.api")
+
 router = APIRouter(prefix="/api", tags=["session"])
 
 
@@ -70,7 +73,7 @@ async def init_session(req: InitRequest):
             should_resume = True
         
         if should_resume:
-            print(f"📌 Resuming session for team '{req.team_id}': phase {existing.current_phase}, complete: {existing.is_complete}")
+            logger.info("📌 Resuming session for team '%s': phase %s, complete: %s", req.team_id, existing.current_phase, existing.is_complete)
             
             # Record current contributor
             update_contributors(existing, req.user_email, req.user_name)
@@ -83,7 +86,7 @@ async def init_session(req: InitRequest):
                 current_phase_start = datetime.now(timezone.utc)
                 existing.phase_start_times[phase_key] = current_phase_start
                 update_session(existing)
-                print(f"  ⏱️ Initialized missing phase start time for {phase_key}")
+                logger.debug("⏱️ Initialized missing phase start time for %s", phase_key)
             
             return InitResponse(
                 session_id=existing.session_id,
@@ -110,7 +113,10 @@ async def init_session(req: InitRequest):
                 current_server_time=datetime.now(timezone.utc)
             )
         else:
-            print(f"🔄 Team '{req.team_id}' selected different usecase (existing: {existing_usecase_id}, requested: {req.usecase_id}). Creating new session.")
+            logger.info(
+                "🔄 Team '%s' selected different usecase (existing: %s, requested: %s). Creating new session.",
+                req.team_id, existing_usecase_id, req.usecase_id
+            )
 
     # 2. Get usecase and theme (from request or assign randomly)
     if req.usecase_id:
@@ -156,7 +162,7 @@ async def init_session(req: InitRequest):
     session.phase_start_times["phase_1"] = start_time
     update_session(session)
     
-    print(f"✨ Created new session for team '{req.team_id}': {session.session_id}")
+    logger.info("✨ Created new session for team '%s': %s", req.team_id, session.session_id)
     
     return InitResponse(
         session_id=session.session_id,
@@ -248,7 +254,7 @@ async def start_phase(req: StartPhaseRequest):
                 reported_delta = req.leaving_phase_elapsed_seconds - old_total
                 
                 if reported_delta > (max_duration + 5.0):
-                   print(f"⚠️ Timer anomaly: Client reported {reported_delta}s delta, but only {max_duration}s passed. Capping.")
+                   logger.warning("⚠️ Timer anomaly: Client reported %ss delta, but only %ss passed. Capping.", reported_delta, max_duration)
                    session.phase_elapsed_seconds[leaving_key] = old_total + max_duration
                 else:
                    session.phase_elapsed_seconds[leaving_key] = req.leaving_phase_elapsed_seconds
@@ -279,9 +285,10 @@ async def start_phase(req: StartPhaseRequest):
                     
                     if status != "passed":
                         # Update existing entry if not passed (don't overwrite passed data with drafts)
-                        print(f"📝 Saving leaving phase responses for '{l_name}':")
-                        for r in req.leaving_phase_responses:
-                            print(f"   - Q: {r.question_id}, hint_used: {r.hint_used}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("📝 Saving leaving phase responses for '%s':", l_name)
+                            for r in req.leaving_phase_responses:
+                                logger.debug("   - Q: %s, hint_used: %s", r.question_id, r.hint_used)
                         
                         if isinstance(leaving_pdata, dict):
                             leaving_pdata['responses'] = req.leaving_phase_responses
@@ -289,7 +296,7 @@ async def start_phase(req: StartPhaseRequest):
                             leaving_pdata.responses = req.leaving_phase_responses
                         session.phases[l_name] = leaving_pdata
                     else:
-                        print(f"⏭️ Skipping response save for '{l_name}' - phase already passed")
+                        logger.debug("⏭️ Skipping response save for '%s' - phase already passed", l_name)
     
     # STEP 2: Get or initialize the target phase's data
     key = f"phase_{req.phase_number}"
@@ -342,14 +349,15 @@ async def start_phase(req: StartPhaseRequest):
             previous_responses = getattr(phase_data, 'responses', None)
     
     # Debug logging for hint persistence
-    if previous_responses:
-        print(f"📤 Returning previous responses for '{phase_name}':")
-        for r in previous_responses:
-            hint = getattr(r, 'hint_used', r.get('hint_used') if isinstance(r, dict) else False)
-            qid = getattr(r, 'question_id', r.get('question_id') if isinstance(r, dict) else '?')
-            print(f"   - Q: {qid}, hint_used: {hint}")
-    else:
-        print(f"📤 No previous responses for '{phase_name}'")
+    if logger.isEnabledFor(logging.DEBUG):
+        if previous_responses:
+            logger.debug("📤 Returning previous responses for '%s':", phase_name)
+            for r in previous_responses:
+                hint = getattr(r, 'hint_used', r.get('hint_used') if isinstance(r, dict) else False)
+                qid = getattr(r, 'question_id', r.get('question_id') if isinstance(r, dict) else '?')
+                logger.debug("   - Q: %s, hint_used: %s", qid, hint)
+        else:
+            logger.debug("📤 No previous responses for '%s'", phase_name)
 
     return StartPhaseResponse(
         phase_id=phase_def.get("id", f"phase_{req.phase_number}"),
@@ -420,7 +428,7 @@ async def save_hint(req: dict):
     session.phases[phase_name] = phase_data
     update_session(session)
     
-    print(f"💡 Hint saved for session {session_id[:8]}, phase '{phase_name}', question '{question_id}'")
+    logger.info("💡 Hint saved for session %s, phase '%s', question '%s'", session_id[:8], phase_name, question_id)
     
     return {"success": True, "message": "Hint saved"}
 
@@ -627,7 +635,7 @@ async def submit_phase(req: SubmitPhaseRequest):
             raise HTTPException(status_code=504, detail=str(e))
         except Exception as e:
             # Catch any other unexpected AI errors
-            print(f"❌ AI Evaluation error: {type(e).__name__}: {e}")
+            logger.error("❌ AI Evaluation error: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"AI evaluation failed: {str(e)}")
 
     # CRITICAL FIX: Re-fetch session to prevent overwriting concurrent updates (like hints)
@@ -724,9 +732,9 @@ async def submit_phase(req: SubmitPhaseRequest):
                 f.write(img_bytes)
             
             evidence_url = f"/generated/{filename}"
-            print(f"📸 Saved phase evidence to {evidence_url}")
+            logger.debug("📸 Saved phase evidence to %s", evidence_url)
         except Exception as e:
-            print(f"⚠️ Failed to persist phase evidence image: {e}")
+            logger.warning("⚠️ Failed to persist phase evidence image: %s", e)
             # Fallback to keeping it in memory/DB if saving fails (not ideal but safe)
 
     # Update phase data
@@ -819,7 +827,7 @@ def _get_retry_info(session: SessionState, phase_name: str) -> tuple[int, str |
             retries = completed_trials
                 
         except Exception as e:
-            print(f"Retry detection error: {e}")
+            logger.warning("Retry detection error: %s", e)
             # Fallback to current increment logic if history parsing fails
             if hasattr(prev_phase_data, 'metrics'):
                 retries = prev_phase_data.metrics.retries + 1
@@ -837,9 +845,6 @@ async def get_session_report(team_id: str):
     """
     from backend.services.pdf_generator import generate_report
     from fastapi.responses import FileResponse
-    import logging
-    
-    logger = logging.getLogger("pitchsync.api")
     
     # 1. Fetch session
     session = get_latest_session_for_team(team_id)
@@ -848,7 +853,7 @@ async def get_session_report(team_id: str):
     
     # 2. Generate PDF
     try:
-        print(f"📄 Generating report for team: {team_id}")
+        logger.info("📄 Generating report for team: %s", team_id)
         pdf_path = generate_report(session)
         
         # 3. Stream file back
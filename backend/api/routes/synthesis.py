@@ -8,8 +8,10 @@ import logging
 import json
 import hashlib
 from datetime import datetime, timezone
+from functools import partial
 from fastapi import APIRouter, HTTPException, File, UploadFile, Form, Depends
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 from backend.models import (
     FinalSynthesisRequest, FinalSynthesisResponse, 
@@ -22,10 +24,13 @@ from backend.services import (
 )
 from backend.services.ai import (
     auto_generate_pitch,
+    synthesize_pitch_stream,
     prepare_master_prompt_draft,
+    prepare_master_prompt_draft_stream,
     generate_customer_image_prompt,
     evaluate_visual_asset_async, # Still need async for image eval? No, we check if sync exists.
-    get_client
+    get_client,
+    image_tasks
 )
 # Check evaluate_visual_asset availability. __init__.py didn't explicitly list it but evaluator.py has it.
 # evaluator.py defines evaluate_visual_asset (sync).
@@ -61,9 +66,57 @@ def prepare_synthesis(req: PrepareSynthesisRequest):
     )
 
 
+@router.post("/prepare-synthesis/stream")
+def prepare_synthesis_stream(req: PrepareSynthesisRequest):
+    """
+    Stream the draft master prompt as Server-Sent Events.
+    Emits `draft_delta` events as the draft is written, then one `complete` event
+    carrying the full `master_prompt_draft`.
+    """
+    session = get_session(req.session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    def generate_stream():
+        chunks = []
+        try:
+            for delta in prepare_master_prompt_draft_stream(
+                usecase=session.usecase,
+                all_phases_data=session.phases
+            ):
+                chunks.append(delta)
+                yield f"data: {json.dumps({'type': 'draft_delta', 'text': delta})}\n\n"
+            yield f"data: {json.dumps({'type': 'complete', 'master_prompt_draft': ''.join(chunks).strip()})}\n\n"
+        except Exception as e:
+            logger.error(f"❌ Streaming draft synthesis failed: {e}")
+            yield f"data: {json.dumps({'type': 'error', 'message': 'Draft synthesis failed. Please try again.'})}\n\n"
+
+    return StreamingResponse(
+        generate_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"  # Disable nginx buffering
+        }
+    )
+
+
+def _store_final_image(session_id: str, image_url: str) -> None:
+    """Persist a deferred final-synthesis render onto its session once it is ready."""
+    session = get_session(session_id)
+    if session:
+        session.final_output.image_url = image_url
+        update_session(session)
+
+
 @router.post("/final-synthesis", response_model=FinalSynthesisResponse)
 def final_synthesis(req: FinalSynthesisRequest):
-    """Generate final pitch with visionary hook and image (async for multi-user)."""
+    """
+    Generate final pitch with visionary hook and image (async for multi-user).
+    With defer_image the response returns before the render finishes and carries an
+    image_task_id to poll; the image URL is saved to the session when the render completes.
+    """
     
     session = get_session(req.session_id)
     if not session:
@@ -74,7 +127,9 @@ def final_synthesis(req: FinalSynthesisRequest):
         result = auto_generate_pitch(
             usecase=session.usecase,
             all_phases_data=session.phases,
-            theme=session.theme_palette
+            theme=session.theme_palette,
+            defer_image=req.defer_image,
+            cache_scope=session.session_id
         )
     except TimeoutError as e:
         raise HTTPException(status_code=504, detail=str(e))
@@ -99,6 +154,11 @@ def final_synthesis(req: FinalSynthesisRequest):
     session.is_complete = True
     
     update_session(session)
+
+    # Registered after the session is saved so the render can't be overwritten with ""
+    image_task_id = result.get('image_task_id')
+    if image_task_id:
+        image_tasks.on_done(image_task_id, partial(_store_final_image, session.session_id))
     
     return FinalSynthesisResponse(
         visionary_hook=result.get('visionary_hook', ''),
@@ -106,10 +166,62 @@ def final_synthesis(req: FinalSynthesisRequest):
         image_url=result.get('image_url', ''),
         prompt_used=result.get('image_prompt', ''),
         total_score=int(session.total_score),
-        phase_breakdown=session.phase_scores
+        phase_breakdown=session.phase_scores,
+        image_task_id=image_task_id
     )
 
 
+@router.post("/synthesize-stream")
+def synthesize_stream(req: FinalSynthesisRequest):
+    """
+    Stream the customer-facing pitch for an edited prompt as Server-Sent Events.
+    Emits `pitch_delta` events as the pitch is written, then one `complete` event
+    with the image prompt and image URL.
+    """
+    session = get_session(req.session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    def generate_stream():
+        try:
+            for event in synthesize_pitch_stream(
+                usecase=session.usecase,
+                edited_prompt=req.edited_prompt,
+                theme=session.theme_palette,
+                cache_scope=session.session_id
+            ):
+                if event["type"] == "complete":
+                    session.final_output.visionary_hook = event.get('visionary_hook', '')
+                    session.final_output.customer_pitch = event.get('customer_pitch', '')
+                    session.final_output.image_prompt = event.get('image_prompt', '')
+                    session.final_output.image_url = event.get('image_url', '')
+                    session.final_output.generated_at = datetime.now(timezone.utc)
+                    update_session(session)
+                yield f"data: {json.dumps(event)}\n\n"
+        except Exception as e:
+            logger.error(f"❌ Streaming synthesis failed: {e}")
+            yield f"data: {json.dumps({'type': 'error', 'message': 'Pitch synthesis failed. Please try again.'})}\n\n"
+
+    return StreamingResponse(
+        generate_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"  # Disable nginx buffering
+        }
+    )
+
+
+@router.get("/image-task/{task_id}")
+def get_image_task(task_id: str):
+    """Poll a deferred image render. Status is pending, done or failed; image_url is set once done."""
+    task = image_tasks.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Image task not found")
+    return {"task_id": task_id, **task}
+
+
 @router.post("/curate-prompt")
 def curate_prompt(req: PrepareSynthesisRequest):
     """Generate customer-focused image prompt from all phases (without generating image yet)."""
@@ -168,7 +280,8 @@ def curate_prompt(req: PrepareSynthesisRequest):
             usecase=session.usecase,
             all_phases_data=session.phases,
             theme=session.theme_palette,
-            additional_notes=additional_notes
+            additional_notes=additional_notes,
+            use_cache=not force
         )
         logger.info(f"🎨 Generated new curated prompt for session {session.session_id[:8]} (Refined: {has_refinements})")
     except TimeoutError as e:
@@ -233,7 +346,7 @@ async def submit_pitch_image(
         
         # 2. Evaluate Image (Visual Forensics) -- BEFORE logos or compression
         # Convert to Base64 for Claude
-        image_b64 = base64.b64encode(file_content).decode("utf-8")
+        image_b64 = await run_in_threadpool(lambda: base64.b64encode(file_content).decode("utf-8"))
         
         logger.info(f"🕵️ Running Visual Forensics on upload for session {session_id[:8]}...")
         client = get_client()
@@ -268,8 +381,7 @@ async def submit_pitch_image(
         filename = f"pitch_{os.urandom(4).hex()}.png"
         filepath = GENERATED_DIR / filename
         
-        with open(filepath, "wb") as buffer:
-            buffer.write(file_content)
+        await run_in_threadpool(filepath.write_bytes, file_content)
             
         logger.debug(f"💾 Pitch image persisted to {filename}")
         
@@ -282,7 +394,8 @@ async def submit_pitch_image(
         team_name = session.team_id  # This is already the display name
         logger.debug(f"🖌️ Overlaying logos for team '{team_name}' on session {session_id[:8]}")
         
-        overlay_logos(str(filepath), logos_to_overlay)
+        # PIL compositing is CPU-bound; keep it off the event loop
+        await run_in_threadpool(overlay_logos, str(filepath), logos_to_overlay)
         
         image_url = f"/generated/{filename}"
         
@@ -333,7 +446,7 @@ async def submit_pitch_image(
             session.uploaded_images.append(new_submission)
             session.uploaded_images = session.uploaded_images[-3:]
         
-        update_session(session)
+        await run_in_threadpool(update_session, session)
         
         return {
             "image_url": image_url,
@@ -62,8 +62,38 @@ class Settings:
     
     # AI Models
     MAX_OUTPUT_TOKENS = 2000
-    CURATOR_MAX_OUTPUT_TOKENS = 2000
-    
+    # The curator replies with a small JSON object; a tighter cap bounds decode time
+    CURATOR_MAX_OUTPUT_TOKENS = int(os.environ.get("PITCHSYNC_CURATOR_MAX_TOKENS", "1000"))
+    # Approximate input-token cap for the Q&A context in curator/narrative prompts
+    CURATOR_CONTEXT_BUDGET = int(os.environ.get("PITCHSYNC_CONTEXT_BUDGET", "6000"))
+
+    # AI Response Cache (exact-match, in-process)
+    RESPONSE_CACHE_ENABLED = os.environ.get("PITCHSYNC_RESPONSE_CACHE", "0").lower() in ("1", "true")
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("PITCHSYNC_RESPONSE_CACHE_SIZE", "512"))
+    # Seconds a cached reply stays valid; 0 keeps entries until evicted
+    RESPONSE_CACHE_TTL_SECONDS = float(os.environ.get("PITCHSYNC_RESPONSE_CACHE_TTL", "3600"))
+    # Calls sampled hotter than this are always sent to the model
+    RESPONSE_CACHE_MAX_TEMPERATURE = float(os.environ.get("PITCHSYNC_RESPONSE_CACHE_MAX_TEMP", "0.8"))
+
+    # AI Semantic Cache (near-duplicate inputs, in-process)
+    SEMANTIC_CACHE_ENABLED = os.environ.get("PITCHSYNC_SEMANTIC_CACHE", "0").lower() in ("1", "true")
+    SEMANTIC_CACHE_THRESHOLD = float(os.environ.get("PITCHSYNC_SEMANTIC_CACHE_THRESHOLD", "0.95"))
+    SEMANTIC_CACHE_MAX_ENTRIES = 64  # per namespace
+    SEMANTIC_CACHE_MAX_NAMESPACES = int(os.environ.get("PITCHSYNC_SEMANTIC_CACHE_MAX_NAMESPACES", "256"))
+    SEMANTIC_CACHE_MAX_WORD_CHANGES = 1  # words added or removed between a hit and the cached input
+
+    # Opt-in: build the synthesize_pitch image prompt from a template instead of a curator call
+    TEMPLATE_IMAGE_PROMPT_ENABLED = os.environ.get("PITCHSYNC_TEMPLATE_IMAGE_PROMPT", "0").lower() in ("1", "true")
+
+    # Write the auto-pipeline's image prompt and narrative in one Claude call (synthesize_all_in_one)
+    FUSED_PITCH_ENABLED = os.environ.get("PITCHSYNC_FUSED_PITCH", "0").lower() in ("1", "true")
+
+    # Worker threads for the async AI wrappers (concurrent blocking Bedrock/Flux calls)
+    AI_EXECUTOR_WORKERS = int(os.environ.get("PITCHSYNC_AI_WORKERS", "10"))
+
+    # Bedrock latency-optimized inference (only some models/regions support it)
+    OPTIMIZED_LATENCY_ENABLED = os.environ.get("PITCHSYNC_OPTIMIZED_LATENCY", "0").lower() in ("1", "true")
+
     # Scoring Weights
     AI_QUALITY_MAX_POINTS = 1000
     RETRY_PENALTY_POINTS = 0
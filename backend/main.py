@@ -16,7 +16,7 @@ from backend.config import settings, GENERATED_DIR
 from backend.database.utils import create_db_and_tables
 from backend.api import session_router, synthesis_router, leaderboard_router, admin_router, auth_router
 from backend.services.state import get_session_count
-from backend.services.ai import shutdown_ai_executor
+from backend.services.ai import shutdown_ai_executor, image_tasks
 
 # Initialize logging and resilience utilities
 import backend.utils  # noqa: F401 - auto-configures logging
@@ -36,6 +36,7 @@ async def lifespan(app: FastAPI):
     # Graceful shutdown
     print(f"👋 {settings.APP_NAME} shutting down...")
     shutdown_ai_executor()  # Clean up AI thread pool
+    image_tasks.shutdown()  # Let deferred image renders finish
 
 
 # Create FastAPI application
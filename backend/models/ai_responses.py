@@ -6,6 +6,9 @@ This eliminates brittle regex-based JSON extraction and provides
 type safety for AI-generated content.
 """
 
+import json
+import logging
+import re
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field, field_validator
 
@@ -84,6 +87,11 @@ class LeadPartnerVerdict(BaseModel):
             return 0.0
 
 
+# Quality suffix appended to image prompts that don't already ask for 8K
+_HIRES_SPECS = ", 8k resolution, photorealistic, octane render, cinematic lighting"
+_8K_RE = re.compile(r"8k", re.IGNORECASE)
+
+
 class ImagePromptSpec(BaseModel):
     """Response model for AI-generated image prompts."""
     final_combined_prompt: str = Field(
@@ -126,8 +134,8 @@ class ImagePromptSpec(BaseModel):
             prompt = ", ".join([c for c in components if c])
         
         # Add quality specs if missing
-        if "8k" not in prompt.lower():
-            prompt += ", 8k resolution, photorealistic, octane render, cinematic lighting"
+        if not _8K_RE.search(prompt):
+            prompt += _HIRES_SPECS
         
         return prompt
 
@@ -177,26 +185,28 @@ class VisualAnalysisResult(BaseModel):
 
 
 
+logger = logging.getLogger("pitchsync.ai")
+
+# Compiled once at import; parse_ai_response runs on every curator/narrative reply
+# A fenced block or, failing that, the outermost {...} span, found in one scan
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(?P<fenced>.*?)\s*```|(?P<bare>\{.*\})', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',\s*([\]}])')
+_UNESCAPED_QUOTE_RE = re.compile(r'(?<!\\)"')
+_KEY_STRING_VALUE_RE = re.compile(r'"([^"]+)"\s*:\s*"(.*?)"(?=\s*[,}\]])', re.DOTALL)
+
+
 def parse_ai_response(response_text: str, model_class: type) -> BaseModel:
     """
     Safely parse AI response text into a Pydantic model with robust repair logic.
     """
-    import json
-    import re
-    import logging
-    logger = logging.getLogger("pitchsync.ai")
-    
     # Clean up the response
     text = response_text.strip()
     
     # 1. Extract JSON block
-    json_match = re.search(r'```(?:json)?\s*(.*?)\s*```', text, re.DOTALL)
+    json_match = _JSON_BLOCK_RE.search(text)
     if json_match:
-        text = json_match.group(1).strip()
-    else:
-        json_match = re.search(r'(\{.*\})', text, re.DOTALL)
-        if json_match:
-            text = json_match.group(1).strip()
+        fenced = json_match.group("fenced")
+        text = (fenced if fenced is not None else json_match.group("bare")).strip()
     
     # 2. Attempt First Pass (Standard)
     try:
@@ -208,7 +218,7 @@ def parse_ai_response(response_text: str, model_class: type) -> BaseModel:
         
         try:
             # REPAIR STEP A: Fix trailing commas
-            repaired = re.sub(r',\s*([\]}])', r'\1', text)
+            repaired = _TRAILING_COMMA_RE.sub(r'\1', text)
             
             # REPAIR STEP B: Escape unescaped double quotes inside string values
             # This heuristic finds "key": "value" and escapes quotes inside "value"
@@ -216,11 +226,11 @@ def parse_ai_response(response_text: str, model_class: type) -> BaseModel:
                 key = match.group(1)
                 value = match.group(2)
                 # Escape double quotes that are NOT already escaped
-                fixed_value = re.sub(r'(?<!\\)"', r'\"', value)
+                fixed_value = _UNESCAPED_QUOTE_RE.sub(r'\"', value)
                 return f'"{key}": "{fixed_value}"'
 
             # Matches "key": "value" followed by structural JSON markers
-            repaired = re.sub(r'"([^"]+)"\s*:\s*"(.*?)"(?=\s*[,}\]])', escape_internal_quotes, repaired, flags=re.DOTALL)
+            repaired = _KEY_STRING_VALUE_RE.sub(escape_internal_quotes, repaired)
             
             # REPAIR STEP C: Handle truncated JSON (basic attempt)
             if repaired.startswith('{') and not repaired.strip().endswith('}'):
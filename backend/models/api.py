@@ -115,6 +115,7 @@ class FinalSynthesisRequest(BaseModel):
     """Final synthesis request with user-edited prompt."""
     session_id: str
     edited_prompt: str
+    defer_image: bool = False  # return an image_task_id instead of waiting for the render
 
 
 class FinalSynthesisResponse(BaseModel):
@@ -125,6 +126,7 @@ class FinalSynthesisResponse(BaseModel):
     prompt_used: str
     total_score: float
     phase_breakdown: Dict[str, float]
+    image_task_id: Optional[str] = None  # set when defer_image was requested; poll /api/image-task/{id}
 
 
 # =============================================================================
@@ -17,6 +17,11 @@ import json
 import os
 from typing import Dict, List, Any, Tuple
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
 # =============================================================================
 # VAULT LOADING LOGIC (Hierarchical)
 # =============================================================================
@@ -31,6 +36,15 @@ def get_vault_root() -> str:
     return os.path.abspath(os.path.join(current_dir, "..", "vault"))
 
 
+def _read_json(path: str) -> Any:
+    """Decode a vault JSON file from its raw bytes, using orjson when installed."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def validate_vault() -> Tuple[bool, List[str]]:
     """
     Validates the vault structure and contents on startup.
@@ -63,8 +77,7 @@ def validate_vault() -> Tuple[bool, List[str]]:
             
             # Validate JSON syntax
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _read_json(file_path)
                     
                 # Validate required fields based on file type
                 if req_file == "usecase.json":
@@ -129,22 +142,21 @@ def discover_usecases() -> List[Dict[str, Any]]:
             usecase_file = os.path.join(item_path, "usecase.json")
             if os.path.exists(usecase_file):
                 try:
-                    with open(usecase_file, "r", encoding="utf-8") as f:
-                        uc_data = json.load(f)
-                        # Ensure ID matches folder name for predictability
-                        uc_data["id"] = item 
-                        
-                        # Automated Asset Discovery: Logos
-                        logo_dir = os.path.join(item_path, "logo")
-                        logos = []
-                        if os.path.exists(logo_dir):
-                            for logo in os.listdir(logo_dir):
-                                if logo.lower().endswith(('.png', '.jpg', '.jpeg', '.svg', '.webp')):
-                                    # URL path: /vault/<usecase_id>/logo/<filename>
-                                    logos.append(f"/vault/{item}/logo/{logo}")
-                        
-                        uc_data["assets"] = {"logos": logos}
-                        usecases.append(uc_data)
+                    uc_data = _read_json(usecase_file)
+                    # Ensure ID matches folder name for predictability
+                    uc_data["id"] = item 
+                    
+                    # Automated Asset Discovery: Logos
+                    logo_dir = os.path.join(item_path, "logo")
+                    logos = []
+                    if os.path.exists(logo_dir):
+                        for logo in os.listdir(logo_dir):
+                            if logo.lower().endswith(('.png', '.jpg', '.jpeg', '.svg', '.webp')):
+                                # URL path: /vault/<usecase_id>/logo/<filename>
+                                logos.append(f"/vault/{item}/logo/{logo}")
+                    
+                    uc_data["assets"] = {"logos": logos}
+                    usecases.append(uc_data)
                 except Exception as e:
                     print(f"Error loading usecase from {item}: {e}")
     
@@ -163,13 +175,12 @@ def discover_themes() -> List[Dict[str, Any]]:
             theme_file = os.path.join(item_path, "theme.json")
             if os.path.exists(theme_file):
                 try:
-                    with open(theme_file, "r", encoding="utf-8") as f:
-                        theme_data = json.load(f)
-                        # We can either use the ID from file or folder
-                        # Let's ensure it has an ID
-                        if not theme_data.get("id"):
-                            theme_data["id"] = f"{item}_theme"
-                        themes.append(theme_data)
+                    theme_data = _read_json(theme_file)
+                    # We can either use the ID from file or folder
+                    # Let's ensure it has an ID
+                    if not theme_data.get("id"):
+                        theme_data["id"] = f"{item}_theme"
+                    themes.append(theme_data)
                 except Exception as e:
                     print(f"Error loading theme from {item}: {e}")
     
@@ -200,8 +211,7 @@ def get_phases_for_usecase(usecase_id: str) -> Dict[int, Dict[str, Any]]:
             return {}
 
     try:
-        with open(phase_file, "r", encoding="utf-8") as f:
-            raw_phases = json.load(f)
+        raw_phases = _read_json(phase_file)
     except Exception as e:
         print(f"Error loading phases for {usecase_id}: {e}")
         return {}
@@ -3,7 +3,8 @@ from backend.services.ai.client import get_client, Models
 from backend.services.ai.evaluator import evaluate_phase
 from backend.services.ai.synthesizer import (
     synthesize_pitch, apply_customer_filter, prepare_master_prompt_draft, auto_generate_pitch,
-    generate_customer_image_prompt
+    synthesize_all_in_one, generate_customer_image_prompt,
+    synthesize_pitch_stream, apply_customer_filter_stream, prepare_master_prompt_draft_stream
 )
 from backend.services.ai.image_gen import generate_image
 
@@ -13,8 +14,11 @@ from backend.services.ai.async_wrapper import (
     synthesize_pitch_async,
     generate_image_async,
     auto_generate_pitch_async,
+    batch_auto_generate_pitch,
     generate_customer_image_prompt_async,
     prepare_master_prompt_draft_async,
+    apply_customer_filter_async,
+    generate_pitch_narrative_async,
     evaluate_visual_asset_async,
     shutdown_ai_executor
 )
@@ -23,15 +27,19 @@ __all__ = [
     "get_client", "Models",
     "evaluate_phase",
     "synthesize_pitch", "apply_customer_filter", "prepare_master_prompt_draft", "auto_generate_pitch",
-    "generate_customer_image_prompt",
+    "synthesize_all_in_one", "generate_customer_image_prompt",
+    "synthesize_pitch_stream", "apply_customer_filter_stream", "prepare_master_prompt_draft_stream",
     "generate_image",
     # Async versions
     "evaluate_phase_async",
     "synthesize_pitch_async",
     "generate_image_async",
     "auto_generate_pitch_async",
+    "batch_auto_generate_pitch",
     "generate_customer_image_prompt_async",
     "prepare_master_prompt_draft_async",
+    "apply_customer_filter_async",
+    "generate_pitch_narrative_async",
     "evaluate_visual_asset_async",
     "shutdown_ai_executor"
 ]
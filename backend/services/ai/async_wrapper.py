@@ -15,11 +15,15 @@ from functools import partial
 from typing import Dict, Any, List, Optional, Tuple
 import logging
 
+from backend.config import settings
+from backend.utils.resilience import retry_with_backoff
+
 logger = logging.getLogger("pitchsync.ai.async")
 
 # Thread pool for AI operations
-# Size is limited to prevent overwhelming the AI API with parallel requests
-_ai_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="ai_worker")
+# Size is limited to prevent overwhelming the AI API with parallel requests;
+# raise PITCHSYNC_AI_WORKERS in step with the Bedrock concurrency quota
+_ai_executor = ThreadPoolExecutor(max_workers=settings.AI_EXECUTOR_WORKERS, thread_name_prefix="ai_worker")
 
 # Maximum time (seconds) to wait for any AI operation before timing out
 # This prevents infinite loading states on the frontend
@@ -158,6 +162,43 @@ async def auto_generate_pitch_async(
         raise TimeoutError(f"Auto pitch generation timed out after {AI_OPERATION_TIMEOUT} seconds. Please try again.")
 
 
+# Bedrock throttling is already retried inside ClaudeClient.generate_content;
+# only a whole-pitch timeout is worth another attempt at this level.
+_auto_generate_pitch_with_retry = retry_with_backoff(
+    max_retries=2, base_delay=2.0, exceptions=(TimeoutError,)
+)(auto_generate_pitch_async)
+
+
+async def batch_auto_generate_pitch(
+    items: List[Dict[str, Any]],
+    max_concurrency: int = 8
+) -> List[Any]:
+    """
+    Auto-generate pitches for several usecases concurrently.
+
+    Each item carries `usecase`, `all_phases_data` and `theme`. At most
+    `max_concurrency` pitches run at once so a large batch cannot starve the
+    shared AI executor. Results come back in input order; a pitch that still
+    fails after its retries is returned as its exception instead of aborting
+    the rest of the batch.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await _auto_generate_pitch_with_retry(
+                usecase=item["usecase"],
+                all_phases_data=item["all_phases_data"],
+                theme=item["theme"]
+            )
+
+    results = await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+    failed = sum(isinstance(result, BaseException) for result in results)
+    if failed:
+        logger.warning(f"⚠️ batch_auto_generate_pitch: {failed}/{len(items)} pitches failed")
+    return results
+
+
 async def generate_customer_image_prompt_async(
     usecase: Dict[str, Any],
     all_phases_data: Dict[str, Any],
@@ -220,6 +261,68 @@ async def prepare_master_prompt_draft_async(
         raise TimeoutError(f"Prompt draft preparation timed out after {AI_OPERATION_TIMEOUT} seconds. Please try again.")
 
 
+async def apply_customer_filter_async(
+    technical_content: str,
+    usecase: Dict[str, Any],
+    use_cache: bool = True
+) -> str:
+    """
+    Async wrapper for apply_customer_filter with timeout protection.
+    """
+    from backend.services.ai.synthesizer import apply_customer_filter
+    
+    loop = asyncio.get_event_loop()
+    
+    try:
+        result = await asyncio.wait_for(
+            loop.run_in_executor(
+                _ai_executor,
+                partial(
+                    apply_customer_filter,
+                    technical_content=technical_content,
+                    usecase=usecase,
+                    use_cache=use_cache
+                )
+            ),
+            timeout=AI_OPERATION_TIMEOUT
+        )
+        return result
+    except asyncio.TimeoutError:
+        logger.error(f"⏱️ apply_customer_filter_async timed out after {AI_OPERATION_TIMEOUT}s")
+        raise TimeoutError(f"Customer filter timed out after {AI_OPERATION_TIMEOUT} seconds. Please try again.")
+
+
+async def generate_pitch_narrative_async(
+    usecase: Dict[str, Any],
+    all_phases_data: Dict[str, Any],
+    use_cache: bool = True
+) -> Dict[str, str]:
+    """
+    Async wrapper for generate_pitch_narrative with timeout protection.
+    """
+    from backend.services.ai.synthesizer import generate_pitch_narrative
+    
+    loop = asyncio.get_event_loop()
+    
+    try:
+        result = await asyncio.wait_for(
+            loop.run_in_executor(
+                _ai_executor,
+                partial(
+                    generate_pitch_narrative,
+                    usecase=usecase,
+                    all_phases_data=all_phases_data,
+                    use_cache=use_cache
+                )
+            ),
+            timeout=AI_OPERATION_TIMEOUT
+        )
+        return result
+    except asyncio.TimeoutError:
+        logger.error(f"⏱️ generate_pitch_narrative_async timed out after {AI_OPERATION_TIMEOUT}s")
+        raise TimeoutError(f"Pitch narrative generation timed out after {AI_OPERATION_TIMEOUT} seconds. Please try again.")
+
+
 async def evaluate_visual_asset_async(
     client,
     prompt: str,
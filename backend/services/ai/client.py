@@ -3,27 +3,54 @@ Claude AI Client (AWS Bedrock)
 Centralized client initialization for Anthropic Claude models.
 """
 
-import boto3
 import json
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from backend.config import settings
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+def _encode_body(body_dict: Dict[str, Any]) -> bytes:
+    """Serialize a Bedrock request body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(body_dict)
+    return json.dumps(body_dict).encode("utf-8")
+
+
+def _decode_body(data: bytes) -> Any:
+    """Decode a Bedrock response body or stream chunk, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. raw control characters inside strings; let the lenient parser try
+    return json.loads(data, strict=False)
+
+
 class ClaudeClient:
     """Client for interacting with Claude Sonnet 4 on AWS Bedrock."""
     def __init__(self):
         """Initialize the Bedrock runtime client."""
+        import boto3
         from botocore.config import Config
         self.region = settings.AWS_REGION
 
         # self.model_id = 'eu.anthropic.claude-sonnet-4-5-20250929-v1:0'
         self.model_id = 'eu.anthropic.claude-haiku-4-5-20251001-v1:0'
         
-        # Configure timeouts for production-grade reliability
+        # Configure timeouts for production-grade reliability.
+        # The pool is sized above botocore's default of 10 so the AI executor and the bulk
+        # fan-outs reuse warm TLS connections instead of reconnecting once it is exhausted.
         config = Config(
             read_timeout=90, 
             connect_timeout=10, 
-            retries={'max_attempts': 1}
+            retries={'max_attempts': 1},
+            max_pool_connections=50,
+            tcp_keepalive=True
         )
         
         # Initialize client
@@ -33,32 +60,16 @@ class ClaudeClient:
             config=config
         )
 
-    def generate_content(
-        self, 
-        prompt: str, 
-        system_prompt: Optional[str] = None,
-        max_tokens: Optional[int] = None, # Defaults to settings.MAX_OUTPUT_TOKENS
-        temperature: float = 0.7,
-        images: Optional[List[Dict[str, str]]] = None
-    ) -> str:
-        """
-        Unified method for generating text with Claude.
-        Supports text-only or multi-modal (text + images) requests.
-        
-        Features:
-        - Automatic retry with exponential backoff for transient errors
-        - Detailed error classification and logging
-        - Circuit breaker integration for service protection
-        
-        Args:
-            images: List of dicts with keys 'data' (base64) and 'media_type' (e.g. 'image/jpeg')
-        """
-        import logging
-        from botocore.exceptions import ClientError, ReadTimeoutError, ConnectTimeoutError
-        import time
-        
-        logger = logging.getLogger("pitchsync.ai")
-        
+    def _build_body(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: Optional[int],
+        temperature: float,
+        images: Optional[List[Dict[str, str]]] = None,
+        tool: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the Anthropic Messages request body shared by the blocking and streaming calls."""
         # Construct message content
         if images:
             content_block = []
@@ -100,6 +111,51 @@ class ClaudeClient:
         if system_prompt:
             body_dict["system"] = system_prompt
 
+        if tool:
+            # Force the reply through the tool so it arrives as schema-shaped input, not prose
+            body_dict["tools"] = [tool]
+            body_dict["tool_choice"] = {"type": "tool", "name": tool["name"]}
+
+        return body_dict
+
+    def generate_content(
+        self, 
+        prompt: str, 
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None, # Defaults to settings.MAX_OUTPUT_TOKENS
+        temperature: float = 0.7,
+        images: Optional[List[Dict[str, str]]] = None,
+        latency: Optional[str] = None,
+        tool: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Unified method for generating text with Claude.
+        Supports text-only or multi-modal (text + images) requests.
+        
+        Features:
+        - Automatic retry with exponential backoff for transient errors
+        - Detailed error classification and logging
+        - Circuit breaker integration for service protection
+        
+        Args:
+            images: List of dicts with keys 'data' (base64) and 'media_type' (e.g. 'image/jpeg')
+            latency: Bedrock performance tier ('standard' or 'optimized'). Only sent when
+                PITCHSYNC_OPTIMIZED_LATENCY is enabled, since not every model/region supports it.
+            tool: Anthropic tool definition ({"name", "description", "input_schema"}) the model
+                is forced to call. The tool input is returned as a JSON string in place of text.
+        """
+        import logging
+        from botocore.exceptions import ClientError, ReadTimeoutError, ConnectTimeoutError
+        import time
+        
+        logger = logging.getLogger("pitchsync.ai")
+        
+        body_dict = self._build_body(prompt, system_prompt, max_tokens, temperature, images, tool)
+
+        invoke_kwargs = {}
+        if latency and settings.OPTIMIZED_LATENCY_ENABLED:
+            invoke_kwargs["performanceConfigLatency"] = latency
+
         # Retry configuration
         max_retries = 2
         base_delay = 2.0
@@ -108,26 +164,33 @@ class ClaudeClient:
         for attempt in range(max_retries + 1):
             try:
                 response = self.client.invoke_model(
-                    body=json.dumps(body_dict),
+                    body=_encode_body(body_dict),
                     modelId=self.model_id,
                     accept='application/json',
-                    contentType='application/json'
+                    contentType='application/json',
+                    **invoke_kwargs
                 )
                 
-                raw_body = response.get('body').read().decode('utf-8')
+                raw_body = response.get('body').read()
                 
                 # Only log in debug mode to prevent sensitive data leakage
                 if settings.DEBUG:
+                    log_body = raw_body.decode('utf-8', errors='replace')
                     with open("claude_debug.log", "a", encoding="utf-8") as f:
                         f.write(f"\n--- {self.model_id} Response ---\n")
-                        f.write(raw_body[:5000] + ('...[truncated]' if len(raw_body) > 5000 else ''))
+                        f.write(log_body[:5000] + ('...[truncated]' if len(log_body) > 5000 else ''))
                         f.write("\n---------------------------\n")
                 
-                response_body = json.loads(raw_body, strict=False)
+                response_body = _decode_body(raw_body)
                 usage = response_body.get('usage', {'input_tokens': 0, 'output_tokens': 0})
                 
-                if 'content' in response_body and len(response_body['content']) > 0:
-                    text = response_body['content'][0]['text']
+                content = response_body.get('content') or []
+                if tool:
+                    for block in content:
+                        if block.get('type') == 'tool_use':
+                            return json.dumps(block.get('input', {}), ensure_ascii=False), usage
+                if len(content) > 0:
+                    text = content[0]['text']
                     return text, usage
                 else:
                     raise ValueError("No content in Claude response")
@@ -171,6 +234,48 @@ class ClaudeClient:
         logger.error(f"❌ All retries exhausted for Claude API call")
         raise last_exception or RuntimeError("Claude API call failed after retries")
 
+    def generate_content_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        latency: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream a text completion, yielding text deltas as Bedrock emits them.
+        Unlike generate_content there is no retry: once text has been yielded a
+        retry would duplicate it, so errors propagate to the caller.
+        """
+        import logging
+        logger = logging.getLogger("pitchsync.ai")
+
+        body_dict = self._build_body(prompt, system_prompt, max_tokens, temperature)
+        invoke_kwargs = {}
+        if latency and settings.OPTIMIZED_LATENCY_ENABLED:
+            invoke_kwargs["performanceConfigLatency"] = latency
+
+        response = self.client.invoke_model_with_response_stream(
+            body=_encode_body(body_dict),
+            modelId=self.model_id,
+            accept='application/json',
+            contentType='application/json',
+            **invoke_kwargs
+        )
+
+        for event in response.get('body'):
+            chunk = event.get('chunk')
+            if not chunk:
+                continue
+            payload = _decode_body(chunk['bytes'])
+            if payload.get('type') == 'content_block_delta':
+                delta = payload.get('delta', {})
+                if delta.get('type') == 'text_delta':
+                    yield delta.get('text', '')
+            elif payload.get('type') == 'message_stop':
+                metrics = payload.get('amazon-bedrock-invocationMetrics', {})
+                logger.debug(f"📡 Stream complete: {metrics.get('outputTokenCount', '?')} output tokens")
+
 class Models:
     """AI Model identifiers."""
     # Default for evaluation (balanced)
@@ -6,6 +6,7 @@ Verified for MaaS (Model-as-a-Service) endpoints.
 
 import os
 import base64
+import logging
 import requests
 from pathlib import Path
 from PIL import Image, ImageStat, ImageFilter, ImageOps, ImageDraw, ImageFont
@@ -13,6 +14,8 @@ from backend.config import settings, GENERATED_DIR
 
 from typing import Dict, Any, List, Optional
 
+logger = logging.getLogger("pitchsync.image")
+
 # Asset paths - Vault root contains usecase folders with their own assets
 BASE_DIR = Path(__file__).parent.parent.parent
 VAULT_ROOT = BASE_DIR / "vault"
@@ -179,12 +182,10 @@ def overlay_logos(image_path: str, logos: list, padding: int = 30, logo_height:
             new_image.paste(logo, (x_pos, y_offset), logo)
         
         new_image.save(image_path, "PNG", optimize=False)
-        print(f"DEBUG: Added blurred mirror header (top) with logos")
+        logger.debug("Added blurred mirror header (top) with logos")
         
     except Exception as e:
-        print(f"WARNING: Failed to overlay logos: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.warning("Failed to overlay logos: %s", e, exc_info=True)
         # Don't raise - image generation should still succeed without logos
 
 
@@ -211,7 +212,7 @@ def upscale_image(image_path: str, target_min_dimension: int = 2048, max_scale:
         
         # Skip if image is already large enough
         if scale_factor <= 1.0:
-            print(f"DEBUG: Image already at target size ({original_width}x{original_height}), skipping upscale")
+            logger.debug("Image already at target size (%dx%d), skipping upscale", original_width, original_height)
             return
         
         # Calculate new dimensions
@@ -224,10 +225,13 @@ def upscale_image(image_path: str, target_min_dimension: int = 2048, max_scale:
         # Save with optimized settings
         upscaled.save(image_path, "PNG", optimize=True)
         
-        print(f"DEBUG: Upscaled image from {original_width}x{original_height} to {new_width}x{new_height} (scale: {scale_factor:.2f}x)")
+        logger.debug(
+            "Upscaled image from %dx%d to %dx%d (scale: %.2fx)",
+            original_width, original_height, new_width, new_height, scale_factor
+        )
         
     except Exception as e:
-        print(f"WARNING: Failed to upscale image: {e}")
+        logger.warning("Failed to upscale image: %s", e)
         # Don't raise - image processing should still succeed without upscaling
 
 
@@ -247,12 +251,9 @@ def generate_image(prompt: str, usecase: Dict[str, Any] = None) -> str:
     Returns:
         URL path to the generated image
     """
-    import logging
     import time
     from requests.exceptions import Timeout, ConnectionError as RequestsConnectionError
     
-    logger = logging.getLogger("pitchsync.image")
-    
     if not settings.FLUX_API_KEY:
         logger.error("FLUX_API_KEY not configured!")
         raise ValueError("Missing FLUX_API_KEY")
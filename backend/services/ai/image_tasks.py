@@ -0,0 +1,95 @@
+"""
+AI Image Tasks
+In-process background rendering for pitch images.
+
+Flux renders take 5-30s. Callers that pass defer_image=True get a task id
+back immediately and the image is rendered on a small dedicated pool; the
+client polls GET /api/image-task/{task_id} for the resulting URL; callers can
+also register on_done() to persist the URL once it exists. Task state lives in
+a bounded in-memory registry, so ids are only valid on the worker that issued
+them and do not survive a restart.
+"""
+
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.services.ai.image_gen import generate_image
+
+logger = logging.getLogger("pitchsync.image")
+
+_MAX_TASKS = 256
+
+_image_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image_task")
+
+# task_id -> {"status": "pending" | "done" | "failed", "image_url": str}, oldest first
+_tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_tasks_lock = threading.Lock()
+# task_id -> callbacks waiting for the rendered image_url (guarded by _tasks_lock)
+_callbacks: Dict[str, List[Callable[[str], None]]] = {}
+
+
+def submit(prompt: str, usecase: Optional[Dict[str, Any]] = None) -> str:
+    """Queue an image render and return its task id."""
+    task_id = uuid.uuid4().hex
+    with _tasks_lock:
+        _tasks[task_id] = {"status": "pending", "image_url": ""}
+        while len(_tasks) > _MAX_TASKS:
+            evicted_id, _ = _tasks.popitem(last=False)
+            _callbacks.pop(evicted_id, None)
+    _image_executor.submit(_run, task_id, prompt, usecase)
+    return task_id
+
+
+def _run(task_id: str, prompt: str, usecase: Optional[Dict[str, Any]]) -> None:
+    try:
+        image_url = generate_image(prompt, usecase=usecase)
+        update = {"status": "done", "image_url": image_url}
+    except Exception as e:
+        logger.warning(f"Deferred image render failed ({task_id[:8]}): {e}")
+        update = {"status": "failed", "image_url": ""}
+    with _tasks_lock:
+        if task_id in _tasks:
+            _tasks[task_id] = update
+        callbacks = _callbacks.pop(task_id, [])
+    if update["status"] == "done":
+        for callback in callbacks:
+            _notify(task_id, callback, update["image_url"])
+
+
+def on_done(task_id: str, callback: Callable[[str], None]) -> None:
+    """
+    Call `callback(image_url)` once the task's render succeeds, or right away if it already has.
+    Nothing is called for failed, unknown or evicted tasks.
+    """
+    with _tasks_lock:
+        task = _tasks.get(task_id)
+        if task is None or task["status"] == "failed":
+            return
+        if task["status"] == "pending":
+            _callbacks.setdefault(task_id, []).append(callback)
+            return
+        image_url = task["image_url"]
+    _notify(task_id, callback, image_url)
+
+
+def _notify(task_id: str, callback: Callable[[str], None], image_url: str) -> None:
+    try:
+        callback(image_url)
+    except Exception as e:
+        logger.warning(f"Image task callback failed ({task_id[:8]}): {e}")
+
+
+def get(task_id: str) -> Optional[Dict[str, Any]]:
+    """Return the state of a task, or None if it is unknown or has been evicted."""
+    with _tasks_lock:
+        task = _tasks.get(task_id)
+        return dict(task) if task is not None else None
+
+
+def shutdown() -> None:
+    """Stop accepting renders and wait for the in-flight ones."""
+    _image_executor.shutdown(wait=True)
@@ -0,0 +1,115 @@
+"""
+AI Response Cache
+Exact-match, content-addressed cache for repeated LLM calls.
+
+Entries are keyed by a SHA-256 digest of the model id, prompt, system prompt,
+temperature, output budget and forced tool, so a hit only happens when the
+same model would receive byte-identical input under the same request shape. Entries are held in a bounded in-process LRU and expire
+after RESPONSE_CACHE_TTL_SECONDS; nothing is written under the vault because
+that directory is served publicly via /vault.
+
+Concurrent identical calls can also be coalesced (single-flight): the first
+caller runs the request and the others wait for its result, so a retry storm
+costs one model call. Callers only coalesce calls they would also cache.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from backend.config import settings
+
+# key -> (monotonic expiry time or None, value), least recently used first
+_cache: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+# key -> Future of the call currently running for that key
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    """Whether response caching is switched on (PITCHSYNC_RESPONSE_CACHE=1)."""
+    return settings.RESPONSE_CACHE_ENABLED
+
+
+def make_key(
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7,
+    model_id: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+    tool: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Build the content-addressed cache key for a single LLM call.
+    `max_tokens` and `tool` are part of the key: a reply truncated by a smaller budget,
+    or a plain-text reply, must never be served to a call forcing a structured tool.
+    """
+    payload = json.dumps(
+        {"m": model_id, "p": prompt, "s": system_prompt, "t": temperature, "n": max_tokens, "tool": tool},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def lookup(key: str) -> Optional[Any]:
+    """Return the cached value for `key`, or None on a miss or once the entry has expired."""
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del _cache[key]
+            return None
+        _cache.move_to_end(key)
+        return value
+
+
+def store(key: str, value: Any) -> None:
+    """Store `value` under `key`, evicting the least recently used entries."""
+    ttl = settings.RESPONSE_CACHE_TTL_SECONDS
+    expires_at = time.monotonic() + ttl if ttl > 0 else None
+    with _cache_lock:
+        _cache[key] = (expires_at, value)
+        _cache.move_to_end(key)
+        while len(_cache) > settings.RESPONSE_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def coalesce(key: str, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+    """
+    Run `compute` once for all concurrent callers sharing `key`.
+    Returns (result, shared): shared is True for callers that waited on another
+    caller's run. Exceptions propagate to every waiting caller.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if not leader:
+        return future.result(), True
+
+    try:
+        result = compute()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result, False
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def clear() -> None:
+    """Drop every cached response."""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,114 @@
+"""
+AI Semantic Cache
+Near-duplicate cache for LLM calls whose inputs differ only by small edits.
+
+Inputs are reduced to bag-of-words term-frequency vectors and compared with
+cosine similarity; a stored response is reused when the best match clears
+SEMANTIC_CACHE_THRESHOLD. Bag-of-words similarity cannot see that "50" became
+"500" or that a "not" was removed, so numbers and negations must also match
+exactly, and a long text can clear the threshold with a swapped product noun,
+so at most SEMANTIC_CACHE_MAX_WORD_CHANGES words may be added or removed.
+Entries are namespaced (e.g. per function, session and usecase) so the filter
+and narrative never serve each other's replies; the least recently used
+namespaces are dropped beyond SEMANTIC_CACHE_MAX_NAMESPACES. Held in memory
+only, like the exact-match response cache.
+"""
+
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.config import settings
+
+_TOKEN_RE = re.compile(r"\w+")
+# Tokens whose edits flip the meaning while barely moving the cosine score
+_GUARD_RE = re.compile(r"\d+(?:[.,]\d+)*|\b(?:not|no|never|none|nor|without|cannot)\b|n't\b", re.IGNORECASE)
+
+# namespace -> list of (term vector, vector norm, guard tokens, cached value), oldest first;
+# namespaces themselves are kept in least-recently-used order
+_entries: "OrderedDict[str, List[Tuple[Counter, float, Counter, Any]]]" = OrderedDict()
+_entries_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    """Whether semantic caching is switched on (PITCHSYNC_SEMANTIC_CACHE=1)."""
+    return settings.SEMANTIC_CACHE_ENABLED
+
+
+def _vectorize(text: str) -> Tuple[Counter, float]:
+    """Term-frequency vector of lowercased word tokens, with its L2 norm."""
+    vector = Counter(_TOKEN_RE.findall(text.lower()))
+    return vector, math.sqrt(sum(count * count for count in vector.values()))
+
+
+def _guard_tokens(text: str) -> Counter:
+    """Numbers and negations in `text`; a cached entry is only reused when these match exactly."""
+    return Counter(match.lower() for match in _GUARD_RE.findall(text))
+
+
+def similarity(a: str, b: str) -> float:
+    """Cosine similarity between two texts' term-frequency vectors."""
+    return _cosine(*_vectorize(a), *_vectorize(b))
+
+
+def _cosine(vec_a: Dict[str, int], norm_a: float, vec_b: Dict[str, int], norm_b: float) -> float:
+    if not norm_a or not norm_b:
+        return 0.0
+    if len(vec_a) > len(vec_b):
+        vec_a, vec_b = vec_b, vec_a
+    dot = sum(count * vec_b.get(term, 0) for term, count in vec_a.items())
+    return dot / (norm_a * norm_b)
+
+
+def _changed_words(vec_a: Counter, vec_b: Counter) -> int:
+    """Number of word tokens added or removed between two term-frequency vectors."""
+    return sum((vec_a - vec_b).values()) + sum((vec_b - vec_a).values())
+
+
+def get(namespace: str, text: str) -> Optional[Any]:
+    """
+    Return the value stored for the most similar text in `namespace`, if similar enough,
+    carrying the same numbers and negations and differing by only a few words.
+    """
+    vector, norm = _vectorize(text)
+    guard = _guard_tokens(text)
+    best_score, best_value = 0.0, None
+    with _entries_lock:
+        bucket = _entries.get(namespace)
+        if bucket is None:
+            return None
+        _entries.move_to_end(namespace)
+        for entry_vector, entry_norm, entry_guard, value in bucket:
+            if entry_guard != guard:
+                continue
+            score = _cosine(vector, norm, entry_vector, entry_norm)
+            if (
+                score > best_score and score >= settings.SEMANTIC_CACHE_THRESHOLD
+                and _changed_words(vector, entry_vector) <= settings.SEMANTIC_CACHE_MAX_WORD_CHANGES
+            ):
+                best_score, best_value = score, value
+    return best_value
+
+
+def set(namespace: str, text: str, value: Any) -> None:
+    """
+    Store `value` for `text` under `namespace`, keeping the newest entries per namespace
+    and the most recently used namespaces overall.
+    """
+    vector, norm = _vectorize(text)
+    guard = _guard_tokens(text)
+    with _entries_lock:
+        bucket = _entries.setdefault(namespace, [])
+        _entries.move_to_end(namespace)
+        bucket.append((vector, norm, guard, value))
+        del bucket[:-settings.SEMANTIC_CACHE_MAX_ENTRIES]
+        while len(_entries) > settings.SEMANTIC_CACHE_MAX_NAMESPACES:
+            _entries.popitem(last=False)
+
+
+def clear() -> None:
+    """Drop every cached entry."""
+    with _entries_lock:
+        _entries.clear()
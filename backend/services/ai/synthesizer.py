@@ -3,92 +3,265 @@ AI Synthesizer Service
 Prompt culmination and customer-centric filtering.
 """
 
+import hashlib
 import json
 import logging
-from typing import Dict, Any, Tuple
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from backend.config import settings
+from backend.models.ai_responses import PitchNarrative, parse_ai_response
+from backend.services.ai import image_tasks, response_cache, semantic_cache
+from backend.services.ai.client import get_client, get_creative_client
+from backend.services.ai.image_gen import generate_image
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
 
 logger = logging.getLogger("pitchsync.ai")
 
 
-from backend.services.ai.client import get_client, get_creative_client
-from backend.services.ai.image_gen import generate_image
+def _loads(data):
+    """Decode JSON (str or bytes), using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. raw control characters inside strings; let the lenient parser try
+    return json.loads(data, strict=False)
+
+
+_JSON_DECODER = json.JSONDecoder(strict=False)
+
+
+def _first_json_object(text: str) -> Optional[Any]:
+    """
+    Decode the JSON value that starts at the first '{' of a model reply, ignoring prose or
+    code fences around it. One linear scan; raises json.JSONDecodeError if it is malformed.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    return _JSON_DECODER.raw_decode(text, start)[0]
+
+
+def _dumps_pretty(obj: Any) -> str:
+    """Indented JSON for frontend-facing manifests, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-string keys; the stdlib encoder handles those
+    return json.dumps(obj, indent=2)
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Compact, non-ASCII-escaped JSON for prompt context, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
 
 # Asset paths - Vault root contains usecase folders with their own assets
 BASE_DIR = Path(__file__).parent.parent.parent
 VAULT_ROOT = BASE_DIR / "vault"
 
+# Theme color keys in prompt order, with the label shown to the model
+_BRAND_COLOR_KEYS = (
+    ("primary", "Primary"),
+    ("secondary", "Secondary"),
+    ("bg", "Background"),
+    ("success", "Success"),
+    ("error", "Error"),
+    ("warning", "Warning"),
+)
+
+
+def _format_theme_colors(theme_colors: Dict[str, Any]) -> list:
+    """Single pass over the known color keys, skipping empty entries."""
+    colors = []
+    for key, label in _BRAND_COLOR_KEYS:
+        value = theme_colors.get(key)
+        if value:
+            colors.append(f"{label}: {value}")
+    return colors
+
+
+@lru_cache(maxsize=128)
+def _read_theme_json(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parsed vault theme.json; the mtime argument invalidates the entry when the file is edited."""
+    return _loads(Path(path_str).read_bytes())
+
+
+# Fallback palette when neither the vault nor the passed theme has colors
+_DEFAULT_BRAND_STR = "Primary: #008B8B (Teal), Secondary: #4DCCCC (Light Blue), Background: #f0f9ff (Soft White)"
+
+
 def _load_brand_colors(usecase: Dict[str, Any] = None, theme: Dict[str, Any] = None) -> str:
     """
     Load and extract brand colors.
     Prioritizes the usecase's specific vault theme to ensure brand consistency.
+    Results are memoized per theme.json mtime, so edits to the vault file are picked up.
     """
+    usecase_id = usecase.get("id") if isinstance(usecase, dict) else None
+    theme_mtime = None
+    if usecase_id:
+        try:
+            theme_mtime = (VAULT_ROOT / usecase_id / "theme.json").stat().st_mtime_ns
+        except OSError:
+            pass
+    theme_colors = theme.get("colors") if isinstance(theme, dict) else None
+    theme_key = tuple(theme_colors.get(k) for k, _ in _BRAND_COLOR_KEYS) if theme_colors else None
+    if theme_mtime is None and not theme_key:
+        return _DEFAULT_BRAND_STR
+    return _load_brand_colors_cached(usecase_id, theme_mtime, theme_key)
+
+
+@lru_cache(maxsize=256)
+def _load_brand_colors_cached(usecase_id: Optional[str], theme_mtime: Optional[int], theme_key: Optional[tuple]) -> str:
+    """Resolve the brand string for hashable (usecase_id, theme.json mtime, passed theme colors)."""
     colors = []
-    usecase_theme_data = None
 
     # Priority 1: Load from usecase's specific vault directory if available
-    if isinstance(usecase, dict):
-        usecase_id = usecase.get("id")
-        if usecase_id:
-            theme_file = VAULT_ROOT / usecase_id / "theme.json"
-            if theme_file.exists():
-                try:
-                    with open(theme_file, encoding="utf-8") as f:
-                        usecase_theme_data = json.load(f)
-                        theme_colors = usecase_theme_data.get("colors", {})
-                        if theme_colors.get("primary"):
-                            colors.append(f"Primary: {theme_colors['primary']}")
-                        if theme_colors.get("secondary"):
-                            colors.append(f"Secondary: {theme_colors['secondary']}")
-                        if theme_colors.get("bg"):
-                            colors.append(f"Background: {theme_colors['bg']}")
-                        if theme_colors.get("success"):
-                            colors.append(f"Success: {theme_colors['success']}")
-                        if theme_colors.get("error"):
-                            colors.append(f"Error: {theme_colors['error']}")
-                        if theme_colors.get("warning"):
-                            colors.append(f"Warning: {theme_colors['warning']}")
-                except Exception as e:
-                    logger.warning(f"Could not load vault theme for {usecase_id}: {e}")
+    if theme_mtime is not None:
+        try:
+            usecase_theme_data = _read_theme_json(str(VAULT_ROOT / usecase_id / "theme.json"), theme_mtime)
+            colors = _format_theme_colors(usecase_theme_data.get("colors", {}))
+        except Exception as e:
+            logger.warning(f"Could not load vault theme for {usecase_id}: {e}")
 
     # Priority 2: Use colors from the passed theme object (if Priority 1 didn't find anything)
-    if not colors and isinstance(theme, dict) and theme.get("colors"):
-        theme_colors = theme["colors"]
-        for key in ["primary", "secondary", "bg", "success", "error", "warning"]:
-            if theme_colors.get(key):
-                colors.append(f"{key.capitalize()}: {theme_colors[key]}")
-    
+    if not colors and theme_key:
+        colors = _format_theme_colors({k: v for (k, _), v in zip(_BRAND_COLOR_KEYS, theme_key, strict=True)})
+
     # Fallback: Default brand colors
-    if colors:
-        return " | ".join(colors)
-    
-    return "Primary: #008B8B (Teal), Secondary: #4DCCCC (Light Blue), Background: #f0f9ff (Soft White)"
+    return " | ".join(colors) if colors else _DEFAULT_BRAND_STR
 
 
-# Default colors for fallback
-DEFAULT_BRAND_COLORS = _load_brand_colors()
+# Public alias of the fallback palette for existing importers
+DEFAULT_BRAND_COLORS = _DEFAULT_BRAND_STR
 
 
-def prepare_master_prompt_draft(
-    usecase: Dict[str, Any],
-    all_phases_data: Dict[str, Any]
-) -> str:
+# Usecase fields that matter for copywriting; ids, complexity and theme refs are dropped
+_NARRATIVE_FIELDS = ("title", "domain", "target_market", "description", "problem", "value_prop", "tagline")
+
+
+def _slim_usecase(usecase: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a usecase down to the fields the narrative prompts actually use."""
+    return {k: usecase[k] for k in _NARRATIVE_FIELDS if k in usecase}
+
+
+def _usecase_json(usecase: Dict[str, Any]) -> str:
+    """Compact JSON of the slim usecase, memoized on its field values across requests."""
+    items = tuple(_slim_usecase(usecase).items())
+    try:
+        return _usecase_json_cached(items)
+    except TypeError:  # unhashable field values (e.g. lists) can't key the cache
+        return _dumps_compact(dict(items))
+
+
+@lru_cache(maxsize=64)
+def _usecase_json_cached(items: tuple) -> str:
+    return _dumps_compact(dict(items))
+
+
+def _response_cache_key(
+    client,
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    use_cache: bool,
+    max_tokens: Optional[int] = None,
+    tool: Optional[Dict[str, Any]] = None
+) -> Optional[str]:
     """
-    Step 1: Create a draft master prompt based on QnA and Usecase using Claude.
+    Response-cache key for a call, or None when the call must not be cached: the caller opted
+    out, the cache is disabled, or it samples above RESPONSE_CACHE_MAX_TEMPERATURE.
+    Shared by the blocking, streaming and fused paths so their keys and gate agree.
     """
-    phase_summaries = _extract_phase_summaries(all_phases_data)
-    full_context = json.dumps(phase_summaries, indent=2)
-    usecase_title = usecase.get('title', 'Unknown')
-    
-    prompt = f"""
-ACT AS A SILICON VALLEY PITCH DOCTOR.
-Synthesize the disjointed team inputs below into a SINGLE, COHESIVE "HIGH-CONCEPT" PITCH SUMMARY.
+    if not (use_cache and response_cache.is_enabled() and temperature <= settings.RESPONSE_CACHE_MAX_TEMPERATURE):
+        return None
+    return response_cache.make_key(
+        prompt, system_prompt, temperature, getattr(client, "model_id", None),
+        max_tokens=max_tokens, tool=tool
+    )
+
+
+def _cached_generate(
+    client,
+    prompt: str,
+    system_prompt: str = None,
+    temperature: float = 0.7,
+    use_cache: bool = True,
+    **kwargs
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    client.generate_content behind the exact-match response cache.
+    Only calls at or below RESPONSE_CACHE_MAX_TEMPERATURE are cached; a hit reports zero usage
+    since no tokens were spent. Cacheable calls are also coalesced: concurrent identical calls
+    share one model call, and the callers that waited report zero usage.
+    """
+    def _call() -> Tuple[str, Dict[str, Any]]:
+        return client.generate_content(
+            prompt=prompt, system_prompt=system_prompt, temperature=temperature, **kwargs
+        )
 
-=== USE CASE ===
-{usecase_title}
+    cache_key = _response_cache_key(
+        client, prompt, system_prompt, temperature, use_cache,
+        max_tokens=kwargs.get("max_tokens"), tool=kwargs.get("tool")
+    )
+    if cache_key is None:
+        return _call()
 
-=== TEAM INPUTS ===
-{full_context}
+    cached = response_cache.lookup(cache_key)
+    if cached is not None:
+        logger.debug("♻️ LLM call served from response cache")
+        return cached[0], {"input_tokens": 0, "output_tokens": 0}
+
+    (response_text, usage), shared = response_cache.coalesce(cache_key, _call)
+    if shared:
+        logger.debug("🔗 LLM call coalesced with an identical in-flight request")
+        return response_text, {"input_tokens": 0, "output_tokens": 0}
+    response_cache.store(cache_key, (response_text, usage))
+    return response_text, usage
+
+
+# Sampling temperatures shared by the blocking and streaming variants, so both hit the same cache keys
+_DRAFT_TEMPERATURE = 0.7
+_FILTER_TEMPERATURE = 0.8
+
+
+# Static instruction blocks for the prompts. They contain no interpolation so
+# the long shared prefix is byte-identical across calls (provider-side prompt
+# caching); per-request data is appended at the tail.
+_DYNAMIC_CONTEXT_SEPARATOR = "\n\n=== DYNAMIC CONTEXT ===\n"
+
+
+def _prompt_skeleton(static_header: str, dynamic_template: str) -> str:
+    """
+    Pre-join a static header and its dynamic template into one str.format_map skeleton.
+    The header is taken literally (its JSON examples keep their braces); only the
+    template's {slots} are substituted per request.
+    """
+    escaped_header = static_header.replace("{", "{{").replace("}", "}}")
+    return escaped_header + _DYNAMIC_CONTEXT_SEPARATOR + dynamic_template
+
+
+_DRAFT_MASTER_HEADER = """
+ACT AS A SILICON VALLEY PITCH DOCTOR.
+Synthesize the disjointed team inputs (see DYNAMIC CONTEXT at the end) into a SINGLE, COHESIVE "HIGH-CONCEPT" PITCH SUMMARY.
 
 === MISSION ===
 Create a 100-word "Elevator Pitch" that explains:
@@ -102,28 +275,145 @@ STYLE:
 - Focus on the core 'Reason to Exist'.
 
 Return ONLY the summary text.
-"""
+""".strip()
+
+_DRAFT_MASTER_SKELETON = _prompt_skeleton(_DRAFT_MASTER_HEADER, """
+=== USE CASE ===
+{usecase_title}
+
+=== TEAM INPUTS ===
+{full_context}
+""")
+
+
+def prepare_master_prompt_draft(
+    usecase: Dict[str, Any],
+    all_phases_data: Dict[str, Any],
+    use_cache: bool = True
+) -> str:
+    """
+    Step 1: Create a draft master prompt based on QnA and Usecase using Claude.
+    Identical inputs are served from the response cache when it is enabled.
+    """
+    prompt = _build_draft_prompt(usecase, all_phases_data)
     client = get_client()
     try:
-        response, usage = client.generate_content(prompt=prompt, temperature=0.7)
+        response, usage = _cached_generate(
+            client, prompt, temperature=_DRAFT_TEMPERATURE, use_cache=use_cache, latency="optimized"
+        )
         return response.strip()
     except Exception as e:
-        logger.error(f"Draft Synthesis Error: {e}")
-        raise e
+        logger.exception(f"Draft Synthesis Error: {e}")
+        raise
+
+
+def prepare_master_prompt_draft_stream(
+    usecase: Dict[str, Any],
+    all_phases_data: Dict[str, Any],
+    use_cache: bool = True
+) -> Iterator[str]:
+    """
+    Streaming variant of prepare_master_prompt_draft: yields the draft as text deltas.
+    A cache hit is yielded as a single chunk; a completed stream populates the cache.
+    """
+    prompt = _build_draft_prompt(usecase, all_phases_data)
+
+    client = get_client()
+    cache_key = _response_cache_key(client, prompt, None, _DRAFT_TEMPERATURE, use_cache)
+    if cache_key is not None:
+        cached = response_cache.lookup(cache_key)
+        if cached is not None:
+            yield cached[0].strip()
+            return
+
+    chunks = []
+    try:
+        for delta in client.generate_content_stream(
+            prompt=prompt, temperature=_DRAFT_TEMPERATURE, latency="optimized"
+        ):
+            if not chunks:
+                delta = delta.lstrip()
+                if not delta:
+                    continue
+            chunks.append(delta)
+            yield delta
+    except Exception as e:
+        logger.exception(f"Draft Synthesis Stream Error: {e}")
+        raise
+
+    if cache_key is not None:
+        response_cache.store(cache_key, ("".join(chunks), {"input_tokens": 0, "output_tokens": 0}))
+
+
+def _build_draft_prompt(usecase: Dict[str, Any], all_phases_data: Dict[str, Any]) -> str:
+    """Draft master prompt shared by the blocking and streaming variants."""
+    # The draft prompt shows the model {"phase", "content"} objects, not bare pairs.
+    # Compact encoding: the model gains nothing from pretty-printing or \uXXXX escapes
+    full_context = _dumps_compact(
+        [{"phase": phase, "content": content} for phase, content in _iter_phase_summaries(all_phases_data)]
+    )
+    return _DRAFT_MASTER_SKELETON.format_map({
+        "usecase_title": usecase.get('title', 'Unknown'),
+        "full_context": full_context,
+    })
 
 
 def synthesize_pitch(
     usecase: Dict[str, Any],
     edited_prompt: str,
-    theme: Dict[str, Any]
+    theme: Dict[str, Any],
+    defer_image: bool = False,
+    cache_scope: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Step 2: Take edited prompt, apply filter, inject theme, and generate assets.
+    With defer_image=True the image is rendered in the background and the result
+    carries an "image_task_id" to poll instead of an image_url.
+    `cache_scope` (e.g. the session id) enables the semantic cache for the filter; see apply_customer_filter.
     """
-    # 1. Customer Centric Filter (Module B)
-    # Applied to the edited prompt to make it more narrative/customer-focused
-    filtered_base_prompt = apply_customer_filter(edited_prompt, usecase)
-    
+    if settings.TEMPLATE_IMAGE_PROMPT_ENABLED:
+        # 1. Customer Centric Filter (Module B)
+        # Applied to the edited prompt to make it more narrative/customer-focused.
+        # The image prompt is then templated from the filtered pitch without a model call.
+        filtered_base_prompt = apply_customer_filter(edited_prompt, usecase, cache_scope=cache_scope)
+        return _render_pitch_assets(usecase, filtered_base_prompt, theme, defer_image=defer_image)
+
+    # 1 + 2. With the curator LLM in play, brief it from the edited prompt so it runs
+    # alongside the customer filter instead of waiting for the filtered pitch.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="synth_pitch") as pool:
+        curator_future = pool.submit(_curate_pitch_image_prompt, usecase, edited_prompt, theme)
+        filtered_base_prompt = apply_customer_filter(edited_prompt, usecase, cache_scope=cache_scope)
+        curated = curator_future.result()
+
+    return _render_pitch_assets(usecase, filtered_base_prompt, theme, defer_image=defer_image, curated=curated)
+
+
+def synthesize_pitch_stream(
+    usecase: Dict[str, Any],
+    edited_prompt: str,
+    theme: Dict[str, Any],
+    cache_scope: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming variant of synthesize_pitch.
+    Yields {"type": "pitch_delta", "text": ...} events while the customer filter is
+    writing, then one {"type": "complete", ...} event carrying the synthesize_pitch result.
+    """
+    chunks = []
+    for delta in apply_customer_filter_stream(edited_prompt, usecase, cache_scope=cache_scope):
+        chunks.append(delta)
+        yield {"type": "pitch_delta", "text": delta}
+
+    result = _render_pitch_assets(usecase, "".join(chunks).strip(), theme)
+    yield {"type": "complete", **result}
+
+
+def _curate_pitch_image_prompt(
+    usecase: Dict[str, Any],
+    visual_concept: str,
+    theme: Dict[str, Any]
+) -> Tuple[str, str]:
+    """Curate the image prompt for a pitch concept. Returns (prompt for Flux, JSON manifest for the frontend)."""
     # 2. Theme Injection & SOTA Prompt Curation
     # We use the JSON-structured curator to ensure high fidelity
     try:
@@ -131,19 +421,46 @@ def synthesize_pitch(
             usecase=usecase,
             all_phases_data={}, # Context already in edited_prompt
             theme=theme,
-            additional_notes=f"Visual Concept: {filtered_base_prompt}"
+            additional_notes=f"Visual Concept: {visual_concept}"
         )
         # Extract the string for generation
         prompt_string_for_gen = final_image_prompt_struct.get("final_combined_prompt", "")
         # Keep full JSON for frontend display
-        final_image_prompt_json_str = json.dumps(final_image_prompt_struct, indent=2)
+        final_image_prompt_json_str = _dumps_pretty(final_image_prompt_struct)
         
     except Exception as e:
         logger.warning(f"Curator fallback error: {e}")
         # Fallback to simple string if curator fails
         theme_name = theme.get('name', 'Modern') if isinstance(theme, dict) else str(theme)
-        prompt_string_for_gen = f"{filtered_base_prompt}. Theme: {theme_name}. Cinematic, 8k Resolution."
+        prompt_string_for_gen = f"{visual_concept}. Theme: {theme_name}. Cinematic, 8k Resolution."
         final_image_prompt_json_str = prompt_string_for_gen
+
+    return prompt_string_for_gen, final_image_prompt_json_str
+
+
+def _render_pitch_assets(
+    usecase: Dict[str, Any],
+    filtered_base_prompt: str,
+    theme: Dict[str, Any],
+    defer_image: bool = False,
+    curated: Optional[Tuple[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    Curate the image prompt for a filtered pitch and render the image (synthesize_pitch steps 2-3).
+    Pass `curated` when the image prompt was already produced alongside the filter.
+    """
+    if curated is None:
+        curated = _curate_pitch_image_prompt(usecase, filtered_base_prompt, theme)
+    prompt_string_for_gen, final_image_prompt_json_str = curated
+
+    if defer_image:
+        return {
+            "visionary_hook": filtered_base_prompt,
+            "customer_pitch": filtered_base_prompt,
+            "image_prompt": final_image_prompt_json_str,
+            "image_url": "",
+            "image_task_id": image_tasks.submit(prompt_string_for_gen, usecase=usecase)
+        }
     
     try:
         # 3. Generate Image (Module D)
@@ -162,18 +479,106 @@ def synthesize_pitch(
         return {
             "visionary_hook": filtered_base_prompt,
             "customer_pitch": filtered_base_prompt,
-            "image_prompt": final_image_prompt_json_str if 'final_image_prompt_json_str' in locals() else "",
+            "image_prompt": final_image_prompt_json_str,
             "image_url": ""
         }
 
 
-def apply_customer_filter(technical_content: str, usecase: Dict[str, Any]) -> str:
+def apply_customer_filter(
+    technical_content: str,
+    usecase: Dict[str, Any],
+    use_cache: bool = True,
+    cache_scope: Optional[str] = None
+) -> str:
     """
     Translate technical content into customer-friendly language using Claude.
+    Identical inputs are served from the response cache, and near-identical technical content
+    from the semantic cache, when those are enabled; pass use_cache=False to force a fresh sample.
+    The semantic cache is only consulted with a `cache_scope` (e.g. the session id), since teams
+    share usecases and must never be served each other's rewrites.
     """
     client = get_client()
-    
-    system_prompt = """
+    system_prompt, prompt = _build_customer_filter_prompt(technical_content, usecase)
+
+    # Near-duplicate edits of the same concept reuse the previous rewrite
+    namespace = _filter_namespace(usecase, cache_scope)
+    use_semantic = use_cache and namespace is not None and semantic_cache.is_enabled()
+    if use_semantic:
+        cached = semantic_cache.get(namespace, technical_content)
+        if cached is not None:
+            logger.debug("♻️ Customer filter served from semantic cache")
+            return cached
+
+    try:
+        response, usage = _cached_generate(
+            client, prompt, system_prompt, temperature=_FILTER_TEMPERATURE, use_cache=use_cache, latency="optimized"
+        )
+        if use_semantic:
+            semantic_cache.set(namespace, technical_content, response.strip())
+        return response.strip()
+    except Exception as e:
+        logger.exception(f"Customer Filter Error: {e}")
+        raise
+
+
+def apply_customer_filter_stream(
+    technical_content: str,
+    usecase: Dict[str, Any],
+    use_cache: bool = True,
+    cache_scope: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Streaming variant of apply_customer_filter: yields the rewrite as text deltas.
+    Cache hits are yielded as a single chunk; a completed stream populates the caches.
+    """
+    system_prompt, prompt = _build_customer_filter_prompt(technical_content, usecase)
+
+    namespace = _filter_namespace(usecase, cache_scope)
+    use_semantic = use_cache and namespace is not None and semantic_cache.is_enabled()
+    if use_semantic:
+        cached = semantic_cache.get(namespace, technical_content)
+        if cached is not None:
+            yield cached
+            return
+
+    client = get_client()
+    cache_key = _response_cache_key(client, prompt, system_prompt, _FILTER_TEMPERATURE, use_cache)
+    if cache_key is not None:
+        cached = response_cache.lookup(cache_key)
+        if cached is not None:
+            yield cached[0].strip()
+            return
+
+    chunks = []
+    try:
+        for delta in client.generate_content_stream(
+            prompt=prompt, system_prompt=system_prompt, temperature=_FILTER_TEMPERATURE, latency="optimized"
+        ):
+            if not chunks:
+                delta = delta.lstrip()
+                if not delta:
+                    continue
+            chunks.append(delta)
+            yield delta
+    except Exception as e:
+        logger.exception(f"Customer Filter Stream Error: {e}")
+        raise
+
+    response = "".join(chunks)
+    if cache_key is not None:
+        response_cache.store(cache_key, (response, {"input_tokens": 0, "output_tokens": 0}))
+    if use_semantic:
+        semantic_cache.set(namespace, technical_content, response.strip())
+
+
+def _filter_namespace(usecase: Dict[str, Any], cache_scope: Optional[str]) -> Optional[str]:
+    """Semantic cache namespace for one scope's customer filter rewrites of a usecase, or None without a scope."""
+    if not cache_scope:
+        return None
+    return f"filter:{cache_scope}:{usecase.get('id') if isinstance(usecase, dict) else usecase}"
+
+
+_CUSTOMER_FILTER_SYSTEM_PROMPT = """
 You are a WORLD-CLASS STARTUP STORYTELLER and MASTER COMMUNICATOR.
 Your job is to translate dense, technical product details into a narrative that creates visceral excitement.
 
@@ -185,17 +590,13 @@ STRICT RULES:
 - NO FLUFF.
 """
 
-    prompt = f"""
+_CUSTOMER_FILTER_HEADER = """
 ACT AS A WORLD-CLASS COPYWRITER (like David Ogilvy met Steve Jobs).
 
 === MISSION ===
-Rewrite the technical input below into a "Hair-on-Fire" Pitch Paragraph (max 150 words).
+Rewrite the technical input (see DYNAMIC CONTEXT at the end) into a "Hair-on-Fire" Pitch Paragraph (max 150 words).
 Your goal is not just to inform, but to **persuade**.
 
-=== INPUT DATA ===
-TECHNICAL CORE: {technical_content}
-CONTEXT: {json.dumps(usecase, indent=2) if isinstance(usecase, dict) else usecase}
-
 === NARRATIVE FRAMEWORK (SOTA) ===
 1. **The Villain**: Start immediately with the painful problem (The "Villain"). Make it visceral.
 2. **The Hero**: Introduce the product as the inevitable "Hero" vehicle.
@@ -209,82 +610,396 @@ CONTEXT: {json.dumps(usecase, indent=2) if isinstance(usecase, dict) else usecas
 - **Constraint**: NO marketing fluff. Direct and bold.
 
 RETURN ONLY THE FINAL PARAGRAPH.
-"""
+""".strip()
+
+_CUSTOMER_FILTER_SKELETON = _prompt_skeleton(_CUSTOMER_FILTER_HEADER, """
+=== INPUT DATA ===
+TECHNICAL CORE: {technical_content}
+CONTEXT: {usecase_context}
+""")
+
+
+def _build_customer_filter_prompt(technical_content: str, usecase: Dict[str, Any]) -> Tuple[str, str]:
+    """Build the customer filter prompts. Returns (system_prompt, prompt)."""
+    usecase_context = _usecase_json(usecase) if isinstance(usecase, dict) else usecase
+    if isinstance(usecase, dict) and logger.isEnabledFor(logging.DEBUG):
+        full_chars = len(json.dumps(usecase, indent=2, default=str))
+        logger.debug(
+            f"✂️ Customer filter usecase context: ~{full_chars // _CHARS_PER_TOKEN} -> "
+            f"~{len(usecase_context) // _CHARS_PER_TOKEN} tokens"
+        )
+    prompt = _CUSTOMER_FILTER_SKELETON.format_map({
+        "technical_content": technical_content,
+        "usecase_context": usecase_context,
+    })
+    return _CUSTOMER_FILTER_SYSTEM_PROMPT, prompt
+
+
+# (question, answer) accessors for PhaseResponse objects and raw response dicts
+_OBJECT_QA = attrgetter('q', 'a')
+
+
+def _dict_qa(response: Dict[str, Any]) -> Tuple[Any, Any]:
+    return response.get('q', 'Question'), response.get('a', '')
+
+
+def synthesize_all_in_one(
+    usecase: Dict[str, Any],
+    all_phases_data: Dict[str, Any],
+    theme: Dict[str, Any],
+    use_cache: bool = True,
+    defer_image: bool = False,
+    cache_scope: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Single-call variant of auto_generate_pitch: one Claude request writes the hook, the
+    customer pitch and the image prompt together, so the Q&A context is sent once.
+    The reply is streamed and the image render starts as soon as the image prompt is complete.
+    Falls back to the split curator + narrative pipeline if the fused reply can't be used.
+    """
+    context = _prompt_context(usecase, all_phases_data, theme)
+    usecase_title = context.usecase_title
+    prompt = _FUSED_PITCH_SKELETON.format_map({
+        "raw_qa_context": _organic_qa_context(context.fitted_summaries),
+        "usecase_title": usecase_title,
+        "usecase_domain": context.usecase_domain,
+        "target_market": context.target_market,
+        "theme_mood": context.theme_mood,
+        "theme_style": context.theme_style,
+        "brand_colors": context.brand_colors,
+    })
+
+    # The reply lists image_prompt first, so the Flux render is started as soon as that
+    # object closes in the stream, while the narrative fields are still being written.
+    # At most one render is started per call; later calls to start_image are no-ops.
+    image = {}  # "struct": clamped image prompt struct, "job": its Future, or task id when deferred
+    image_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fused_image")
+
+    def start_image(struct: Dict[str, Any]) -> None:
+        if "job" in image:
+            return
+        prompt_str = _clamp_image_prompt(struct["final_combined_prompt"])
+        image["struct"] = {**struct, "final_combined_prompt": prompt_str}
+        image["job"] = (
+            image_tasks.submit(prompt_str, usecase=usecase) if defer_image
+            else image_pool.submit(generate_image, prompt_str, usecase=usecase)
+        )
 
     try:
-        response, usage = client.generate_content(prompt=prompt, system_prompt=system_prompt, temperature=0.8)
-        return response.strip()
-    except Exception as e:
-        logger.error(f"Customer Filter Error: {e}")
-        raise e
+        try:
+            response_text = _generate_fused_reply(prompt, use_cache, on_image_prompt=start_image)
+            parsed = _first_json_object(response_text) or {}
+            image_struct = parsed.get("image_prompt")
+            if not isinstance(image_struct, dict) or not image_struct.get("final_combined_prompt"):
+                raise ValueError("Fused reply has no image prompt")
+        except Exception as e:
+            if "job" not in image:
+                logger.warning(f"Fused pitch synthesis failed for '{usecase_title}', using split pipeline: {e}")
+                return _split_generate_pitch(
+                    usecase, all_phases_data, theme, defer_image=defer_image, cache_scope=cache_scope
+                )
+            # The image prompt arrived before the reply broke and its render is already running:
+            # keep it and only generate the missing narrative, rather than curating a second image
+            logger.warning(f"Fused reply for '{usecase_title}' failed after its image prompt, generating the narrative separately: {e}")
+            parsed = generate_pitch_narrative(
+                usecase, all_phases_data, use_cache=use_cache, context=context, cache_scope=cache_scope
+            )
+        else:
+            start_image(image_struct)  # cache hits and coalesced callers never saw it mid-stream
 
+        result = {
+            "visionary_hook": parsed.get("visionary_hook") or "See your vision realized.",
+            "customer_pitch": parsed.get("customer_pitch") or "Generated from your phases.",
+            "image_prompt": _dumps_pretty(image["struct"]),
+            "image_url": ""
+        }
+        logger.info(f"✅ Success: [FUSED] pitch generated for '{usecase_title}'")
 
-def _extract_phase_summaries(all_phases_data: Dict[str, Any]) -> list:
-    """Extract full Q&A context from all phases."""
-    phase_summaries = []
-    
+        if defer_image:
+            result["image_task_id"] = image["job"]
+            return result
+        try:
+            result["image_url"] = image["job"].result()
+        except Exception as e:
+            logger.warning(f"Auto-gen image failed: {e}")
+        return result
+    finally:
+        image_pool.shutdown(wait=False)
+
+
+_FUSED_TEMPERATURE = 0.7
+
+
+def _generate_fused_reply(prompt: str, use_cache: bool, on_image_prompt) -> str:
+    """
+    Stream the fused reply, calling `on_image_prompt(struct)` as soon as a nested object
+    carrying a final_combined_prompt has fully arrived. Replies go through the response
+    cache under the same gate as _cached_generate: a hit returns without streaming, and a
+    concurrent identical call waits for the in-flight stream instead of starting its own.
+    """
+    client = get_creative_client()
+
+    def _stream() -> str:
+        scanner = _JsonStreamScanner()
+        chunks = []
+        for delta in client.generate_content_stream(prompt, temperature=_FUSED_TEMPERATURE, latency="optimized"):
+            chunks.append(delta)
+            for object_text in scanner.feed(delta):
+                try:
+                    struct = _loads(object_text)
+                except ValueError:
+                    continue
+                if isinstance(struct, dict) and struct.get("final_combined_prompt"):
+                    on_image_prompt(struct)
+        return "".join(chunks)
+
+    cache_key = _response_cache_key(client, prompt, None, _FUSED_TEMPERATURE, use_cache)
+    if cache_key is None:
+        return _stream()
+
+    cached = response_cache.lookup(cache_key)
+    if cached is not None:
+        return cached[0]
+    response_text, shared = response_cache.coalesce(cache_key, _stream)
+    if not shared:
+        response_cache.store(cache_key, (response_text, {"input_tokens": 0, "output_tokens": 0}))
+    return response_text
+
+
+class _JsonStreamScanner:
+    """
+    Incremental, string-aware brace matcher for a streamed JSON reply.
+    feed() returns the text of every object nested directly inside the outermost
+    object as soon as its closing brace arrives.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._nested = None  # chars of the depth-2 object being captured
+
+    def feed(self, chunk: str) -> List[str]:
+        completed = []
+        for char in chunk:
+            if self._nested is not None:
+                self._nested.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                # Quotes in any prose before the JSON starts are not strings
+                self._in_string = self._depth > 0
+            elif char == "{":
+                self._depth += 1
+                if self._depth == 2:
+                    self._nested = ["{"]
+            elif char == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 1 and self._nested is not None:
+                    completed.append("".join(self._nested))
+                    self._nested = None
+        return completed
+
+
+def _iter_phase_summaries(all_phases_data: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (phase name, Q&A text) for each phase of the Q&A,
+    skipping phases with no answered responses.
+    """
     for phase_name, phase_data in all_phases_data.items():
-        if hasattr(phase_data, 'responses'):
-            responses = phase_data.responses
-        elif isinstance(phase_data, dict):
-            responses = phase_data.get('responses', [])
+        # Raw session dicts are the common case, so test for them before the attribute probe
+        if isinstance(phase_data, dict):
+            responses = phase_data.get('responses')
         else:
+            responses = getattr(phase_data, 'responses', None)
+        if not responses:
             continue
             
-        qa_pairs = []
-        for r in responses:
-            # Handle object or dict access
-            if hasattr(r, 'q') and hasattr(r, 'a'):
-                q_text = r.q
-                a_text = r.a
-            elif isinstance(r, dict):
-                q_text = r.get('q', 'Question')
-                a_text = r.get('a', '')
-            else:
-                continue
-                
-            qa_pairs.append(f"Q: {q_text}\nA: {a_text}")
-        
-        phase_summaries.append({
-            "phase": phase_name,
-            "content": "\n\n".join(qa_pairs)
-        })
-    
-    return phase_summaries
+        # Responses within a phase are homogeneous, so sniff the first one and
+        # pick the dict or object accessor once for the whole list
+        first = responses[0]
+        if isinstance(first, dict):
+            get_qa = _dict_qa
+        elif hasattr(first, 'q') and hasattr(first, 'a'):
+            get_qa = _OBJECT_QA
+        else:
+            continue
 
-def auto_generate_pitch(
+        yield phase_name, "\n\n".join([f"Q: {q}\nA: {a}" for q, a in map(get_qa, responses)])
+
+
+def _extract_phase_summaries(all_phases_data: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Materialized _iter_phase_summaries, for callers that walk the summaries more than once
+    (budget fitting, the curator's structural cache key and the prompt builders).
+    """
+    return list(_iter_phase_summaries(all_phases_data))
+
+
+def _has_answered_responses(all_phases_data: Dict[str, Any]) -> bool:
+    """True when any phase holds a response whose answer is not blank."""
+    for phase_data in all_phases_data.values():
+        if isinstance(phase_data, dict):
+            responses = phase_data.get('responses')
+        else:
+            responses = getattr(phase_data, 'responses', None)
+        for response in responses or ():
+            answer = response.get('a', '') if isinstance(response, dict) else getattr(response, 'a', '')
+            if str(answer or '').strip():
+                return True
+    return False
+
+
+# Rough chars-per-token ratio for English prose; close enough for budgeting
+_CHARS_PER_TOKEN = 4
+
+
+def _fit_phase_budget(phase_summaries: List[Tuple[str, str]], max_tokens: int) -> List[Tuple[str, str]]:
+    """
+    Clip phase contents so the combined Q&A context stays within `max_tokens`.
+    The budget is shared fairly: short phases keep everything and hand their unused
+    share to longer ones, which keep their head (earliest Q&A) and lose the tail.
+    """
+    budget = max_tokens * _CHARS_PER_TOKEN
+    if sum(len(content) for _, content in phase_summaries) <= budget:
+        return phase_summaries
+
+    order = sorted(range(len(phase_summaries)), key=lambda i: len(phase_summaries[i][1]))
+    allowance = {}
+    remaining = budget
+    for rank, i in enumerate(order):
+        allowance[i] = min(len(phase_summaries[i][1]), remaining // (len(order) - rank))
+        remaining -= allowance[i]
+
+    fitted = []
+    for i, (phase, content) in enumerate(phase_summaries):
+        if len(content) > allowance[i]:
+            content = content[:allowance[i]].rstrip() + "\n[...truncated]"
+        fitted.append((phase, content))
+
+    logger.debug("✂️ Q&A context clipped to ~%d tokens across %d phases", max_tokens, len(phase_summaries))
+    return fitted
+
+
+@dataclass(slots=True)
+class _PromptContext:
+    """Per-request prompt inputs, derived once and shared by the sibling curator and narrative calls."""
+    phase_summaries: list   # as extracted; the curator's structural cache key
+    fitted_summaries: list  # clipped to CURATOR_CONTEXT_BUDGET; what the prompts embed
+    brand_colors: str
+    # usecase/theme fields with the curator defaults already applied
+    usecase_title: str
+    usecase_domain: str
+    target_market: str
+    theme_mood: str
+    theme_style: str
+
+
+def _prompt_context(
     usecase: Dict[str, Any],
     all_phases_data: Dict[str, Any],
     theme: Dict[str, Any]
+) -> _PromptContext:
+    """Walk the Q&A, fit it to the context budget and resolve the palette, once per request."""
+    return _build_prompt_context(usecase, theme, _extract_phase_summaries(all_phases_data))
+
+
+def _build_prompt_context(
+    usecase: Dict[str, Any],
+    theme: Dict[str, Any],
+    phase_summaries: List[Tuple[str, str]]
+) -> _PromptContext:
+    theme = theme if isinstance(theme, dict) else {}
+    return _PromptContext(
+        phase_summaries=phase_summaries,
+        fitted_summaries=_fit_phase_budget(phase_summaries, settings.CURATOR_CONTEXT_BUDGET),
+        brand_colors=_load_brand_colors(usecase, theme),
+        usecase_title=usecase.get('title', 'Unknown Product'),
+        usecase_domain=usecase.get('domain', 'Technology'),
+        target_market=usecase.get('target_market', 'Businesses'),
+        theme_mood=theme.get('mood', 'Professional, Modern'),
+        theme_style=theme.get('visual_style', 'Clean, high-fidelity'),
+    )
+
+
+def auto_generate_pitch(
+    usecase: Dict[str, Any],
+    all_phases_data: Dict[str, Any],
+    theme: Dict[str, Any],
+    defer_image: bool = False,
+    cache_scope: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Automated pipeline: QnA -> Customer Image Prompt -> Narrative -> Image.
+    Automated pipeline: QnA -> (Customer Image Prompt || Narrative) -> Image.
+    With PITCHSYNC_FUSED_PITCH=1 the prompt and narrative come from one Claude call
+    (synthesize_all_in_one); otherwise they are two concurrent calls.
+    With defer_image=True the image is rendered in the background (see synthesize_pitch).
+    `cache_scope` (e.g. the session id) enables the narrative's semantic cache.
     """
-    # 1. Summarize and Curate Image Prompt
-    customer_image_prompt_struct, _ = generate_customer_image_prompt(usecase, all_phases_data, theme)
-    
-    prompt_str = customer_image_prompt_struct.get("final_combined_prompt", "")
-    full_json = json.dumps(customer_image_prompt_struct, indent=2)
-    
-    # 2. Generate Narrative (Hook + Pitch)
-    # Uses the new context-aware generator
-    narrative = generate_pitch_narrative(usecase, all_phases_data)
-    
-    # 3. Generate Image
-    # Note: If the user is on the manual path, this might be skipped in favor of client-side upload,
-    # but for the auto-pipeline we generate it here.
-    try:
-        image_url = generate_image(prompt_str, usecase=usecase)
-    except Exception as e:
-        logger.warning(f"Auto-gen image failed: {e}")
-        image_url = ""
+    if settings.FUSED_PITCH_ENABLED:
+        return synthesize_all_in_one(
+            usecase, all_phases_data, theme, defer_image=defer_image, cache_scope=cache_scope
+        )
+    return _split_generate_pitch(usecase, all_phases_data, theme, defer_image=defer_image, cache_scope=cache_scope)
+
+
+def _split_generate_pitch(
+    usecase: Dict[str, Any],
+    all_phases_data: Dict[str, Any],
+    theme: Dict[str, Any],
+    defer_image: bool = False,
+    cache_scope: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Curator and narrative as separate calls. They are independent, so they run concurrently,
+    and the image render starts as soon as the curator is done rather than after the narrative.
+    """
+    # Walk the Q&A once; both the curator and the narrative read the same context
+    context = _prompt_context(usecase, all_phases_data, theme)
+
+    # 1 + 2. Curate Image Prompt and Generate Narrative (Hook + Pitch) side by side.
+    # boto3 clients are thread-safe, so both calls can share the creative client.
+    image_task_id = None
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="auto_pitch") as pool:
+        curator_future = pool.submit(
+            generate_customer_image_prompt, usecase, all_phases_data, theme, context=context
+        )
+        narrative_future = pool.submit(
+            generate_pitch_narrative, usecase, all_phases_data, context=context, cache_scope=cache_scope
+        )
+        customer_image_prompt_struct, _ = curator_future.result()
+        prompt_str = customer_image_prompt_struct.get("final_combined_prompt", "")
+
+        # 3. Generate Image, overlapping whatever is left of the narrative call.
+        # Note: If the user is on the manual path, this might be skipped in favor of client-side upload,
+        # but for the auto-pipeline we generate it here.
+        if defer_image:
+            image_task_id = image_tasks.submit(prompt_str, usecase=usecase)
+        else:
+            image_future = pool.submit(generate_image, prompt_str, usecase=usecase)
+        narrative = narrative_future.result()
+
+        if not defer_image:
+            try:
+                image_url = image_future.result()
+            except Exception as e:
+                logger.warning(f"Auto-gen image failed: {e}")
+                image_url = ""
     
-    return {
+    full_json = _dumps_pretty(customer_image_prompt_struct)
+    result = {
         "visionary_hook": narrative.get("visionary_hook", "See your vision realized."),
         "customer_pitch": narrative.get("customer_pitch", "Generated from your phases."),
         "image_prompt": full_json,
-        "image_url": image_url
     }
+    if defer_image:
+        return {**result, "image_url": "", "image_task_id": image_task_id}
+    return {**result, "image_url": image_url}
 
 
 # =============================================================================
@@ -295,12 +1010,82 @@ def auto_generate_pitch(
 USE_ORGANIC_CURATOR = True
 # =============================================================================
 
+# Bump whenever the curator prompt templates change so stale structs are not reused
+_IMAGE_PROMPT_TEMPLATE_VERSION = "v3"
+
+# Latest curated struct per structural key (every input except brand palette and
+# refinement notes) -> (struct, brand_colors, additional_notes). A palette-only change
+# is served by recolouring; a notes-only change by a small delta-refinement call.
+_CURATOR_CACHE_MAX_ENTRIES = 128
+# structural key -> (latest struct, its brand colors, its notes, the no-notes base struct in those colors or None)
+_curator_cache: "OrderedDict[str, Tuple[Dict[str, Any], str, Optional[str], Optional[Dict[str, Any]]]]" = OrderedDict()
+_curator_cache_lock = threading.Lock()
+
+_LABELLED_HEX_RE = re.compile(r"(\w+):\s*(#[0-9A-Fa-f]{3,8})\b")
+_HEX_RE = re.compile(r"#[0-9A-Fa-f]{3,8}\b")
+
+
+def _curator_cache_key(
+    usecase: Dict[str, Any],
+    theme: Dict[str, Any],
+    phase_summaries: list
+) -> str:
+    """Hash the structural curator inputs (everything except palette and refinement notes)."""
+    theme = theme if isinstance(theme, dict) else {}
+    payload = json.dumps({
+        "version": _IMAGE_PROMPT_TEMPLATE_VERSION,
+        "usecase": usecase.get("id") or usecase.get("title"),
+        "domain": usecase.get("domain"),
+        "mood": theme.get("mood"),
+        "style": theme.get("visual_style"),
+        "phases": phase_summaries,
+        "organic": USE_ORGANIC_CURATOR,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _remap_brand_colors(
+    struct: Dict[str, Any],
+    old_colors: str,
+    new_colors: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Recolour a cached curator struct from one brand palette to another.
+    Returns None when the palettes can't be matched label-for-label or the
+    cached prompt never used the old hex codes, so the caller falls back to the LLM.
+    """
+    old_hex = dict(_LABELLED_HEX_RE.findall(old_colors))
+    new_hex = dict(_LABELLED_HEX_RE.findall(new_colors))
+    mapping = {
+        old_hex[label].lower(): new_hex[label]
+        for label in old_hex
+        if label in new_hex and old_hex[label].lower() != new_hex[label].lower()
+    }
+    if not mapping:
+        return None
+
+    def _swap(match: "re.Match") -> str:
+        return mapping.get(match.group(0).lower(), match.group(0))
+
+    final_prompt = struct.get("final_combined_prompt", "")
+    recoloured_prompt = _HEX_RE.sub(_swap, final_prompt)
+    if recoloured_prompt == final_prompt:
+        return None
+
+    recoloured = {k: _HEX_RE.sub(_swap, v) if isinstance(v, str) else v for k, v in struct.items()}
+    recoloured["final_combined_prompt"] = recoloured_prompt
+    return recoloured
+
 
 def generate_customer_image_prompt(
     usecase: Dict[str, Any], 
     all_phases_data: Dict[str, Any],
     theme: Dict[str, Any],
-    additional_notes: str = None
+    additional_notes: str = None,
+    phase_summaries: list = None,
+    use_cache: bool = True,
+    force_llm: bool = False,
+    context: Optional[_PromptContext] = None
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Creates a comprehensive, customer-centric image prompt for pitch presentations.
@@ -310,18 +1095,148 @@ def generate_customer_image_prompt(
     - False: Classic approach - structured 3-panel Problem→Solution→Outcome layout
     
     ALWAYS outputs prompts for 16:9 aspect ratio images with light-mode aesthetics.
+
+    Pass `phase_summaries` when the caller has already extracted them to skip re-walking the Q&A,
+    or a `_PromptContext` when a sibling call shares the same fitted Q&A and palette.
+    With the response cache enabled, a previous call that shared the same structural inputs
+    is reused: identical inputs return its struct as is, a palette-only change is recoloured
+    without calling the model, and a notes-only change is applied to the no-notes base struct
+    with a short delta-refinement call, so successive notes replace each other instead of piling up.
+    Pass use_cache=False to force a fresh, full curation.
+
+    With no answered Q&A and only a visual concept in `additional_notes` (the synthesize_pitch
+    path, or phases whose answers are all blank) the curator would mostly echo the concept.
+    When PITCHSYNC_TEMPLATE_IMAGE_PROMPT=1 the prompt is then built from a template without
+    calling the model, unless force_llm=True.
     """
-    phase_summaries = _extract_phase_summaries(all_phases_data)
-    
-    # Extract key details from usecase
-    usecase_title = usecase.get('title', 'Unknown Product')
-    usecase_domain = usecase.get('domain', 'Technology')
-    target_market = usecase.get('target_market', 'Businesses')
-    brand_colors = _load_brand_colors(usecase, theme)
-    
-    # Extract theme metadata for curative alignment
-    theme_mood = theme.get('mood', 'Professional, Modern') if isinstance(theme, dict) else 'Professional, Modern'
-    theme_style = theme.get('visual_style', 'Clean, high-fidelity') if isinstance(theme, dict) else 'Clean, high-fidelity'
+    if context is not None:
+        phase_summaries = context.phase_summaries
+    elif phase_summaries is None:
+        phase_summaries = _extract_phase_summaries(all_phases_data)
+
+    if (
+        additional_notes and not force_llm and settings.TEMPLATE_IMAGE_PROMPT_ENABLED
+        and not _has_answered_responses(all_phases_data)
+    ):
+        return _template_curated_prompt(usecase, theme, additional_notes), {"input_tokens": 0, "output_tokens": 0}
+    prompt, usecase_title, brand_colors = _prepare_curator_request(
+        usecase, all_phases_data, theme, additional_notes, phase_summaries=phase_summaries, context=context
+    )
+
+    cache_key = _curator_cache_key(usecase, theme, phase_summaries)
+    cached = None
+    # The structural shortcuts reuse earlier replies, so they follow the opt-in response cache
+    if use_cache and response_cache.is_enabled():
+        with _curator_cache_lock:
+            cached = _curator_cache.get(cache_key)
+
+    base_struct = None
+    if cached is not None:
+        cached_struct, cached_colors, cached_notes, cached_base = cached
+        if cached_colors == brand_colors:
+            base_struct = cached_base
+        if cached_notes == additional_notes and cached_colors == brand_colors:
+            logger.debug("♻️ Curator prompt for '%s' served from structural cache", usecase_title)
+            return dict(cached_struct), {"input_tokens": 0, "output_tokens": 0}
+        elif cached_notes == additional_notes:
+            recoloured = _remap_brand_colors(cached_struct, cached_colors, brand_colors)
+            if recoloured is not None:
+                logger.debug("🎨 Recoloured cached curator prompt for '%s'", usecase_title)
+                if cached_base is not None:
+                    base_struct = _remap_brand_colors(cached_base, cached_colors, brand_colors)
+                _store_curated(cache_key, recoloured, brand_colors, additional_notes, base_struct)
+                return recoloured, {"input_tokens": 0, "output_tokens": 0}
+        elif additional_notes and base_struct is not None:
+            refined = _refine_curated_prompt(base_struct, additional_notes, usecase_title, use_cache)
+            if refined is not None:
+                _store_curated(cache_key, refined[0], brand_colors, additional_notes, base_struct)
+                return refined
+
+    # Use Claude Sonnet 4.5 for creative image prompt generation
+    client = get_creative_client()
+    try:
+        mode_label = "ORGANIC" if USE_ORGANIC_CURATOR else "CLASSIC"
+        logger.debug("[%s CURATOR] Analyzing idea for '%s'...", mode_label, usecase_title)
+        
+        response_text, usage = _cached_generate(
+            client, prompt, temperature=0.7, use_cache=use_cache,
+            max_tokens=settings.CURATOR_MAX_OUTPUT_TOKENS, latency="optimized", tool=_CURATOR_TOOL
+        )
+        
+        parsed_json = _finalize_curator_response(response_text, usecase_title)
+        _store_curated(cache_key, parsed_json, brand_colors, additional_notes, base_struct)
+        return parsed_json, usage
+        
+    except Exception as e:
+        logger.exception(f"❌ Critical Image Curator Error: {e}")
+        return _curator_fallback(usecase_title, brand_colors), {"input_tokens": 0, "output_tokens": 0}
+
+
+def _store_curated(
+    cache_key: str,
+    struct: Dict[str, Any],
+    brand_colors: str,
+    additional_notes: Optional[str],
+    base_struct: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Remember the latest curated struct for a structural key, evicting the oldest keys.
+    A struct curated without notes is its own base; otherwise `base_struct` carries the
+    no-notes struct (in the same brand colors) forward for later refinements.
+    """
+    if not additional_notes:
+        base_struct = struct
+    with _curator_cache_lock:
+        _curator_cache[cache_key] = (struct, brand_colors, additional_notes, base_struct)
+        _curator_cache.move_to_end(cache_key)
+        while len(_curator_cache) > _CURATOR_CACHE_MAX_ENTRIES:
+            _curator_cache.popitem(last=False)
+
+
+def _refine_curated_prompt(
+    base_struct: Dict[str, Any],
+    additional_notes: str,
+    usecase_title: str,
+    use_cache: bool = True
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Apply a refinement request to the no-notes curated struct with a short delta prompt,
+    instead of re-sending the full Q&A context. Returns None on failure so the caller
+    can fall back to a full curation.
+    """
+    prompt = _DELTA_REFINEMENT_SKELETON.format_map({
+        "cached_json": _dumps_compact(base_struct),
+        "additional_notes": additional_notes,
+    })
+    try:
+        response_text, usage = _cached_generate(
+            get_creative_client(), prompt, temperature=0.7, use_cache=use_cache,
+            max_tokens=settings.CURATOR_MAX_OUTPUT_TOKENS, latency="optimized", tool=_CURATOR_TOOL
+        )
+        refined = _finalize_curator_response(response_text, usecase_title)
+    except Exception as e:
+        logger.warning(f"Delta refinement failed for '{usecase_title}', running full curation: {e}")
+        return None
+    logger.debug("✏️ Applied refinement to cached curator prompt for '%s'", usecase_title)
+    return refined, usage
+
+
+def _prepare_curator_request(
+    usecase: Dict[str, Any],
+    all_phases_data: Dict[str, Any],
+    theme: Dict[str, Any],
+    additional_notes: str = None,
+    phase_summaries: list = None,
+    context: Optional[_PromptContext] = None
+) -> Tuple[str, str, str]:
+    """Build the curator prompt. Returns (prompt, usecase_title, brand_colors)."""
+    if context is None:
+        if phase_summaries is None:
+            phase_summaries = _extract_phase_summaries(all_phases_data)
+        context = _build_prompt_context(usecase, theme, phase_summaries)
+    phase_summaries = context.fitted_summaries
+    usecase_title = context.usecase_title
+    brand_colors = context.brand_colors
 
     refinement_instruction = ""
     if additional_notes:
@@ -331,120 +1246,139 @@ USER REFINEMENT REQUEST:
 This MUST be prominently reflected in the visual.
 """
 
-    # Build raw Q&A context
-    raw_qa_context = ""
-    for phase_data in phase_summaries:
-        p_name = phase_data.get("phase", "Unknown Phase")
-        p_content = phase_data.get("content", "")
-        if p_content:
-            raw_qa_context += f"\n--- {p_name} ---\n{p_content}\n"
-
     # =========================================================================
     # SELECT PROMPT BASED ON MODE
     # =========================================================================
+    # Each mode walks phase_summaries exactly once: the raw Q&A context is only
+    # needed by the organic prompt, the classic builder does its own single pass.
     if USE_ORGANIC_CURATOR:
         prompt = _build_organic_curator_prompt(
-            raw_qa_context, usecase_title, usecase_domain, target_market,
-            brand_colors, refinement_instruction, theme_mood, theme_style
+            _organic_qa_context(phase_summaries), usecase_title, context.usecase_domain,
+            context.target_market, brand_colors, refinement_instruction,
+            context.theme_mood, context.theme_style
         )
     else:
         prompt = _build_classic_curator_prompt(
-            phase_summaries, usecase_title, usecase_domain, target_market,
-            brand_colors, refinement_instruction, theme_mood, theme_style
+            phase_summaries, usecase_title, context.usecase_domain,
+            context.target_market, brand_colors, refinement_instruction,
+            context.theme_mood, context.theme_style
         )
+    return prompt, usecase_title, brand_colors
 
-    # Use Claude Sonnet 4.5 for creative image prompt generation
-    client = get_creative_client()
+
+_CURATOR_HIRES_SPECS = ", 8K resolution, professional presentation quality"
+# Every marker the safety clamps look for, found in one case-insensitive scan
+_SPEC_RE = re.compile(r"16[:x]9|8k|light|dark", re.IGNORECASE)
+
+
+def _clamp_image_prompt(final_prompt: str) -> str:
+    """Safety clamps: every image prompt asks for 16:9, 8K and a light-mode slide."""
+    # The clamp suffixes below never add a marker, so one scan of the original suffices
+    found = {match.lower() for match in _SPEC_RE.findall(final_prompt)}
+    if "16:9" not in found and "16x9" not in found:
+        final_prompt = f"16:9 widescreen aspect ratio, {final_prompt}"
+    
+    if "8k" not in found:
+        final_prompt += _CURATOR_HIRES_SPECS
+
+    if "light" not in found or "dark" in found:
+        final_prompt += ", light mode, bright white background, high-key lighting"
+    return final_prompt
+
+
+def _organic_qa_context(phase_summaries: List[Tuple[str, str]]) -> str:
+    """Raw Q&A block used by the organic curator and the fused pitch prompt."""
+    return "".join([
+        f"\n--- {phase} ---\n{content}\n"
+        for phase, content in phase_summaries
+        if content
+    ])
+
+
+def _finalize_curator_response(response_text: str, usecase_title: str) -> Dict[str, Any]:
+    """Parse the curator's JSON reply and apply the 16:9 / 8K / light-mode safety clamps."""
+    mode_label = "ORGANIC" if USE_ORGANIC_CURATOR else "CLASSIC"
+
+    # Parse the response
     try:
-        mode_label = "ORGANIC" if USE_ORGANIC_CURATOR else "CLASSIC"
-        logger.debug(f"[{mode_label} CURATOR] Analyzing idea for '{usecase_title}'...")
-        
-        response_text, usage = client.generate_content(
-            prompt=prompt,
-            temperature=0.7
-        )
-        
-        # Parse the response
-        import re
-        json_match = re.search(r'\{[\s\S]*\}', response_text)
-        if json_match:
-            try:
-                parsed_json = json.loads(json_match.group())
-                final_prompt = parsed_json.get("final_combined_prompt", "")
-                
-                if USE_ORGANIC_CURATOR:
-                    logger.debug(f"[{mode_label} CURATOR] Interpretation: {parsed_json.get('idea_interpretation', 'N/A')}")
-                    logger.debug(f"[{mode_label} CURATOR] Layout: {parsed_json.get('chosen_layout', 'N/A')}")
-                
-                if not final_prompt:
-                    raise ValueError("Empty prompt")
-                    
-            except json.JSONDecodeError:
-                final_prompt = response_text
-                parsed_json = {"final_combined_prompt": final_prompt}
-        else:
-            final_prompt = response_text
-            parsed_json = {"final_combined_prompt": final_prompt}
-        
-        # Safety clamps
-        if "16:9" not in final_prompt.lower() and "16x9" not in final_prompt.lower():
-            final_prompt = f"16:9 widescreen aspect ratio, {final_prompt}"
-        
-        if "8k" not in final_prompt.lower():
-            final_prompt += ", 8K resolution, professional presentation quality"
+        parsed_json = _first_json_object(response_text)
+    except json.JSONDecodeError:
+        parsed_json = None
+    if isinstance(parsed_json, dict):
+        final_prompt = parsed_json.get("final_combined_prompt", "")
+
+        if USE_ORGANIC_CURATOR:
+            logger.debug("[%s CURATOR] Interpretation: %s", mode_label, parsed_json.get('idea_interpretation', 'N/A'))
+            logger.debug("[%s CURATOR] Layout: %s", mode_label, parsed_json.get('chosen_layout', 'N/A'))
+
+        if not final_prompt:
+            raise ValueError("Empty prompt")
+    else:
+        final_prompt = response_text
+        parsed_json = {"final_combined_prompt": final_prompt}
+    
+    parsed_json["final_combined_prompt"] = _clamp_image_prompt(final_prompt)
+    
+    logger.info(f"✅ Success: [{mode_label} CURATOR] prompt generated for '{usecase_title}'")
+    return parsed_json
 
-        if "light" not in final_prompt.lower() or "dark" in final_prompt.lower():
-            final_prompt += ", light mode, bright white background, high-key lighting"
-        
-        parsed_json["final_combined_prompt"] = final_prompt
-        
-        logger.info(f"✅ Success: [{mode_label} CURATOR] prompt generated for '{usecase_title}'")
-        return parsed_json, usage
-        
-    except Exception as e:
-        logger.error(f"❌ Critical Image Curator Error: {e}")
-        return {
-            "final_combined_prompt": f"Professional 16:9 widescreen single-slide pitch for {usecase_title}. Clean modern layout. Light-mode, bright white background. Brand colors: {brand_colors}. 8K resolution.",
-            "idea_interpretation": "Fallback due to error",
-            "chosen_layout": "simple centered",
-            "layout_rationale": "Error fallback"
-        }, {"input_tokens": 0, "output_tokens": 0}
 
+def _template_curated_prompt(
+    usecase: Dict[str, Any],
+    theme: Dict[str, Any],
+    additional_notes: str
+) -> Dict[str, Any]:
+    """Curator-shaped struct for a ready-made visual concept, built without the model."""
+    usecase_title = usecase.get('title', 'Unknown Product')
+    brand_colors = _load_brand_colors(usecase, theme)
+    theme_style = theme.get('visual_style', 'Clean, high-fidelity') if isinstance(theme, dict) else 'Clean, high-fidelity'
+    logger.debug("📐 Template image prompt for '%s' (no curator call)", usecase_title)
+    return {
+        "final_combined_prompt": (
+            f"Professional 16:9 widescreen single-slide customer pitch visual for '{usecase_title}'. "
+            f"{additional_notes}. Style: {theme_style}, clean modern layout, readable headline and key "
+            f"metric callouts. Light mode, bright white background, high-key lighting. "
+            f"Brand colors: {brand_colors}. 8K resolution, professional presentation quality."
+        ),
+        "idea_interpretation": additional_notes,
+        "chosen_layout": "single hero concept",
+        "layout_rationale": "Template from the user's edited concept"
+    }
 
-def _build_organic_curator_prompt(
-    raw_qa_context: str,
-    usecase_title: str,
-    usecase_domain: str,
-    target_market: str,
-    brand_colors: str,
-    refinement_instruction: str,
-    theme_mood: str = "Modern",
-    theme_style: str = "High-fidelity"
-) -> str:
-    """
-    ORGANIC CURATOR PROMPT (New Approach)
-    - Reads Q&A deeply and interprets the idea
-    - Chooses layout organically based on content
-    - No fixed structure enforced
-    """
-    return f"""
-You are a VISUAL STORYTELLER and PITCH DESIGNER.
 
-Your task: Read the participant's Q&A responses below, deeply understand their IDEA, and design a SINGLE-SLIDE VISUAL PITCH that authentically represents their concept.
+def _curator_fallback(usecase_title: str, brand_colors: str) -> Dict[str, Any]:
+    """Deterministic image prompt used when the curator call fails."""
+    return {
+        "final_combined_prompt": f"Professional 16:9 widescreen single-slide pitch for {usecase_title}. Clean modern layout. Light-mode, bright white background. Brand colors: {brand_colors}. 8K resolution.",
+        "idea_interpretation": "Fallback due to error",
+        "chosen_layout": "simple centered",
+        "layout_rationale": "Error fallback"
+    }
 
-=== PARTICIPANT'S IDEA (Q&A Responses) ===
-{raw_qa_context}
 
-=== CONTEXT ===
-Product/Concept: "{usecase_title}"
-Domain: {usecase_domain}
-Target Audience: {target_market}
-Brand Mood: {theme_mood}
-Visual Style Guide: {theme_style}
-{refinement_instruction}
+_DELTA_REFINEMENT_HEADER = """
+You are refining an existing image-generation prompt for a 16:9 widescreen, light-mode pitch slide.
 
-=== BRAND COLORS (Must Use) ===
-{brand_colors}
+RULES:
+- Apply the USER REFINEMENT REQUEST so it is prominently reflected in the visual.
+- Keep the layout, brand colors, text and everything else the user did not ask to change.
+- Keep "final_combined_prompt" self-contained: 16:9 aspect ratio, light mode, 8K resolution.
+
+Return ONLY valid JSON with exactly the same keys as EXISTING PROMPT JSON.
+""".strip()
+
+_DELTA_REFINEMENT_SKELETON = _prompt_skeleton(_DELTA_REFINEMENT_HEADER, """
+EXISTING PROMPT JSON:
+{cached_json}
+
+USER REFINEMENT REQUEST:
+"{additional_notes}"
+""")
+
+_ORGANIC_CURATOR_HEADER = """
+You are a VISUAL STORYTELLER and PITCH DESIGNER.
+
+Your task: Read the participant's Q&A responses (see DYNAMIC CONTEXT at the end), deeply understand their IDEA, and design a SINGLE-SLIDE VISUAL PITCH that authentically represents their concept.
 
 === YOUR TASK ===
 
@@ -472,7 +1406,7 @@ Write a detailed, specific image generation prompt that:
 2. Includes SPECIFIC details from the Q&A (names, metrics, features mentioned)
 3. Shows the product/solution in action with realistic UI or system elements
 4. Incorporates human elements (users benefiting, teams collaborating)
-5. Uses the brand colors as the dominant visual theme
+5. Uses the BRAND COLORS from the context as the dominant visual theme
 
 === VISUAL STYLE (Non-Negotiable) ===
 - FORMAT: 16:9 widescreen presentation slide
@@ -483,92 +1417,28 @@ Write a detailed, specific image generation prompt that:
 
 === OUTPUT FORMAT ===
 Return ONLY a JSON object:
-{{
+{
     "idea_interpretation": "1-2 sentences describing what you understood as the core idea",
     "chosen_layout": "The layout type you chose (e.g., 'hub-and-spoke', 'timeline flow', 'hero metric', etc.)",
     "layout_rationale": "Why this layout fits the idea",
     "final_combined_prompt": "The complete, detailed image generation prompt (include all specifics: layout, content, colors, style, 16:9 format, light-mode background, 8K quality)"
-}}
+}
 
 BE AUTHENTIC to the participant's idea. The visual should feel like THEIR pitch, not a generic template.
-"""
-
+""".strip()
 
-def _build_classic_curator_prompt(
-    phase_summaries: list,
-    usecase_title: str,
-    usecase_domain: str,
-    target_market: str,
-    brand_colors: str,
-    refinement_instruction: str,
-    theme_mood: str = "Modern",
-    theme_style: str = "High-fidelity"
-) -> str:
-    """
-    CLASSIC CURATOR PROMPT (Original Approach)
-    - Structured 3-panel Problem→Solution→Outcome layout
-    - Categorizes Q&A into problem/solution/market/benefit buckets
-    - Consistent, predictable output format
-    """
-    # Structured extraction of Q&A insights for coherent story-building
-    problem_insights = []
-    solution_insights = []
-    market_insights = []
-    benefit_insights = []
-    
-    structured_context = ""
-    for phase_data in phase_summaries:
-        p_name = phase_data.get("phase", "Unknown Phase")
-        p_content = phase_data.get("content", "")
-        phase_lower = p_name.lower()
-        
-        if p_content:
-            structured_context += f"\n### {p_name} ###\n{p_content}\n"
-            
-            if any(kw in phase_lower for kw in ['problem', 'challenge', 'pain', 'issue', 'need']):
-                problem_insights.append(p_content)
-            elif any(kw in phase_lower for kw in ['solution', 'approach', 'how', 'method', 'architecture']):
-                solution_insights.append(p_content)
-            elif any(kw in phase_lower for kw in ['market', 'customer', 'audience', 'user', 'target']):
-                market_insights.append(p_content)
-            elif any(kw in phase_lower for kw in ['benefit', 'value', 'outcome', 'result', 'impact']):
-                benefit_insights.append(p_content)
-    
-    story_summary = f"""
-PROBLEM BEING SOLVED: {' | '.join(problem_insights[:2]) if problem_insights else 'Streamlining business operations'}
-SOLUTION APPROACH: {' | '.join(solution_insights[:2]) if solution_insights else 'Intelligent automation platform'}
-TARGET CUSTOMERS: {' | '.join(market_insights[:2]) if market_insights else target_market}
-KEY BENEFITS: {' | '.join(benefit_insights[:2]) if benefit_insights else 'Efficiency gains and cost reduction'}
-"""
-    
-    return f"""
+_CLASSIC_CURATOR_HEADER = """
 ACT AS A SILICON VALLEY PITCH DESIGNER who creates COMPELLING VISUAL MOCKUPS for investor presentations.
 
-Your task: Synthesize the Q&A insights below into ONE COHERENT, CUSTOMER-CENTRIC SINGLE-SLIDE PITCH MOCKUP.
+Your task: Synthesize the Q&A insights (see DYNAMIC CONTEXT at the end) into ONE COHERENT, CUSTOMER-CENTRIC SINGLE-SLIDE PITCH MOCKUP.
 The slide must communicate Problem → Solution → Outcome in a single frame with calm, modern clarity.
 
 === CRITICAL FORMAT REQUIREMENT ===
 The image MUST be in **16:9 ASPECT RATIO** (widescreen presentation format).
 This is NON-NEGOTIABLE - always specify "16:9 aspect ratio" in the prompt.
 
-{refinement_instruction}
-
-=== PRODUCT CONTEXT ===
-PRODUCT NAME: "{usecase_title}"
-DOMAIN: {usecase_domain}
-TARGET MARKET: {target_market}
-BRAND MOOD: {theme_mood}
-VISUAL STYLE: {theme_style}
-
-=== SYNTHESIZED STORY FROM Q&A ===
-{story_summary}
-
-=== FULL Q&A CONTEXT (for specific details) ===
-{structured_context}
-
 === BRAND COLOR PALETTE (MUST USE) ===
-{brand_colors}
-These colors MUST be the dominant visual theme. Use them for backgrounds, accents, headers, and key elements.
+The BRAND COLORS listed in the context MUST be the dominant visual theme. Use them for backgrounds, accents, headers, and key elements.
 
 === YOUR MISSION ===
 Create a prompt that generates a **COHESIVE SINGLE-SLIDE PITCH MOCKUP** showing:
@@ -586,51 +1456,171 @@ Create a prompt that generates a **COHESIVE SINGLE-SLIDE PITCH MOCKUP** showing:
   • Clear visual hierarchy showing the transformation
   • Human elements (users, customers) benefiting from the solution
   • Dashboard or interface mockup showing the product in use
-- **COLORS**: Dominant use of the brand palette specified above, with the theme color clearly highlighted throughout
+- **COLORS**: Dominant use of the brand palette, with the theme color clearly highlighted throughout
 - **TEXT**: Include readable headlines/metrics that tell the value story
 - **AVOID**: Abstract shapes without meaning, aggressive or noisy visuals, generic stock imagery, cluttered designs.
 
 === OUTPUT FORMAT (JSON) ===
-Return ONLY a JSON object with 'final_combined_prompt' containing a detailed, specific prompt:
+Return ONLY a JSON object with 'final_combined_prompt' containing a detailed, specific prompt.
+Example shape (placeholders in <ANGLE BRACKETS> come from the context):
 
-{{
-    "final_combined_prompt": "A professional 16:9 widescreen single-slide customer pitch mockup for '{usecase_title}'. [FORMAT: 16:9 aspect ratio, presentation slide] [LAYOUT: 3-panel transformation journey showing Problem → Solution → Outcome] [PROBLEM PANEL: Visual of specific pain point] [SOLUTION PANEL: Clean interface mockup showing the product in action] [OUTCOME PANEL: Success dashboard with metrics, happy customer icons] [STYLE: Calm modern LIGHT-MODE, bright white background, clean isometric/flat design] [COLORS: Primary {brand_colors} with theme color highlighted] [TEXT: Readable headlines and metric callouts] [QUALITY: Professional, 8K resolution, presentation-ready]"
-}}
+{
+    "final_combined_prompt": "A professional 16:9 widescreen single-slide customer pitch mockup for '<PRODUCT NAME>'. [FORMAT: 16:9 aspect ratio, presentation slide] [LAYOUT: 3-panel transformation journey showing Problem → Solution → Outcome] [PROBLEM PANEL: Visual of specific pain point] [SOLUTION PANEL: Clean interface mockup showing the product in action] [OUTCOME PANEL: Success dashboard with metrics, happy customer icons] [STYLE: Calm modern LIGHT-MODE, bright white background, clean isometric/flat design] [COLORS: Primary <BRAND COLORS> with theme color highlighted] [TEXT: Readable headlines and metric callouts] [QUALITY: Professional, 8K resolution, presentation-ready]"
+}
 
 BE SPECIFIC! Pull actual details from the Q&A context - names, numbers, features mentioned.
 DO NOT be vague. The mockup should tell a clear, cohesive story specific to THIS solution.
-"""
+""".strip()
+
+
+# Curator replies are forced through this tool, so Bedrock returns the JSON object as
+# structured tool input instead of free text that may be fenced, truncated or malformed.
+# The classic curator only fills final_combined_prompt; the other fields are optional.
+_CURATOR_TOOL = {
+    "name": "emit_image_prompt",
+    "description": "Return the curated image-generation prompt for the pitch slide.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "idea_interpretation": {"type": "string"},
+            "chosen_layout": {"type": "string"},
+            "layout_rationale": {"type": "string"},
+            "final_combined_prompt": {"type": "string"},
+        },
+        "required": ["final_combined_prompt"],
+    },
+}
+
+_ORGANIC_CURATOR_SKELETON = _prompt_skeleton(_ORGANIC_CURATOR_HEADER, """
+=== PARTICIPANT'S IDEA (Q&A Responses) ===
+{raw_qa_context}
 
+=== CONTEXT ===
+Product/Concept: "{usecase_title}"
+Domain: {usecase_domain}
+Target Audience: {target_market}
+Brand Mood: {theme_mood}
+Visual Style Guide: {theme_style}
+{refinement_instruction}
 
-def generate_pitch_narrative(
-    usecase: Dict[str, Any],
-    all_phases_data: Dict[str, Any]
-) -> Dict[str, str]:
+=== BRAND COLORS (Must Use) ===
+{brand_colors}
+""")
+
+_CLASSIC_CURATOR_SKELETON = _prompt_skeleton(_CLASSIC_CURATOR_HEADER, """
+=== PRODUCT CONTEXT ===
+PRODUCT NAME: "{usecase_title}"
+DOMAIN: {usecase_domain}
+TARGET MARKET: {target_market}
+BRAND MOOD: {theme_mood}
+VISUAL STYLE: {theme_style}
+{refinement_instruction}
+
+=== BRAND COLORS ===
+{brand_colors}
+
+=== SYNTHESIZED STORY FROM Q&A ===
+{story_summary}
+
+=== FULL Q&A CONTEXT (for specific details) ===
+{structured_context}
+""")
+
+
+def _build_organic_curator_prompt(
+    raw_qa_context: str,
+    usecase_title: str,
+    usecase_domain: str,
+    target_market: str,
+    brand_colors: str,
+    refinement_instruction: str,
+    theme_mood: str = "Modern",
+    theme_style: str = "High-fidelity"
+) -> str:
     """
-    Generate the text component of the final pitch (Hook + Narrative) 
-    based on the full Q&A context.
+    ORGANIC CURATOR PROMPT (New Approach)
+    - Reads Q&A deeply and interprets the idea
+    - Chooses layout organically based on content
+    - No fixed structure enforced
+    """
+    return _ORGANIC_CURATOR_SKELETON.format_map({
+        "raw_qa_context": raw_qa_context,
+        "usecase_title": usecase_title,
+        "usecase_domain": usecase_domain,
+        "target_market": target_market,
+        "theme_mood": theme_mood,
+        "theme_style": theme_style,
+        "refinement_instruction": refinement_instruction,
+        "brand_colors": brand_colors,
+    })
+
+
+# Phase-name keywords for the classic story buckets, checked in order (first match wins):
+# problem, solution, market, benefit. Plain substring alternations, one scan per category.
+_PHASE_CATEGORY_RES = (
+    re.compile(r"problem|challenge|pain|issue|need"),
+    re.compile(r"solution|approach|how|method|architecture"),
+    re.compile(r"market|customer|audience|user|target"),
+    re.compile(r"benefit|value|outcome|result|impact"),
+)
+
+
+def _build_classic_curator_prompt(
+    phase_summaries: list,
+    usecase_title: str,
+    usecase_domain: str,
+    target_market: str,
+    brand_colors: str,
+    refinement_instruction: str,
+    theme_mood: str = "Modern",
+    theme_style: str = "High-fidelity"
+) -> str:
+    """
+    CLASSIC CURATOR PROMPT (Original Approach)
+    - Structured 3-panel Problem→Solution→Outcome layout
+    - Categorizes Q&A into problem/solution/market/benefit buckets
+    - Consistent, predictable output format
     """
-    phase_summaries = _extract_phase_summaries(all_phases_data)
+    # Structured extraction of Q&A insights for coherent story-building
+    insights = ([], [], [], [])
     
-    # Build full context
-    all_answers_context = ""
-    for phase_data in phase_summaries:
-        p_name = phase_data.get("phase", "Unknown Phase")
-        p_content = phase_data.get("content", "")
+    context_parts = []
+    for p_name, p_content in phase_summaries:
         if p_content:
-            all_answers_context += f"=== {p_name} ===\n{p_content}\n\n"
+            context_parts.append(f"\n### {p_name} ###\n{p_content}\n")
             
-    usecase_title = usecase.get('title', 'Product')
+            phase_lower = p_name.lower()
+            for bucket, pattern in zip(insights, _PHASE_CATEGORY_RES, strict=True):
+                if pattern.search(phase_lower):
+                    bucket.append(p_content)
+                    break
+    problem_insights, solution_insights, market_insights, benefit_insights = insights
+    
+    structured_context = "".join(context_parts)
+    
+    story_summary = f"""
+PROBLEM BEING SOLVED: {' | '.join(problem_insights[:2]) if problem_insights else 'Streamlining business operations'}
+SOLUTION APPROACH: {' | '.join(solution_insights[:2]) if solution_insights else 'Intelligent automation platform'}
+TARGET CUSTOMERS: {' | '.join(market_insights[:2]) if market_insights else target_market}
+KEY BENEFITS: {' | '.join(benefit_insights[:2]) if benefit_insights else 'Efficiency gains and cost reduction'}
+"""
     
-    prompt = f"""
+    return _CLASSIC_CURATOR_SKELETON.format_map({
+        "usecase_title": usecase_title,
+        "usecase_domain": usecase_domain,
+        "target_market": target_market,
+        "theme_mood": theme_mood,
+        "theme_style": theme_style,
+        "refinement_instruction": refinement_instruction,
+        "brand_colors": brand_colors,
+        "story_summary": story_summary,
+        "structured_context": structured_context,
+    })
+
+
+_NARRATIVE_HEADER = """
 ACT AS A WORLD-CLASS STARTUP PITCH COACH.
-Your goal is to synthesize the team's disparate Q&A inputs into a COHESIVE, PERSUASIVE PITCH NARRATIVE.
-
-=== TEAM INPUT DATA (Q&A) ===
-{all_answers_context}
-
-=== CONTEXT ===
-Product: {usecase_title}
+Your goal is to synthesize the team's disparate Q&A inputs (see DYNAMIC CONTEXT at the end) into a COHESIVE, PERSUASIVE PITCH NARRATIVE.
 
 === TASKS ===
 1. **VISIONARY HOOK**: Write ONE single, high-impact sentence (MAX 12 words).
@@ -640,24 +1630,166 @@ Product: {usecase_title}
    - Format: Return points separated by bullets (•) or on new lines.
 
 === OUTPUT FORMAT (JSON) ===
-Return ONLY `{{ "visionary_hook": "...", "customer_pitch": "..." }}`
-"""
+Return ONLY `{ "visionary_hook": "...", "customer_pitch": "..." }`
+""".strip()
+
+
+_NARRATIVE_SKELETON = _prompt_skeleton(_NARRATIVE_HEADER, """
+=== CONTEXT ===
+Product: {usecase_title}
+
+=== TEAM INPUT DATA (Q&A) ===
+{all_answers_context}
+""")
+
+
+_FUSED_PITCH_HEADER = """
+ACT AS A WORLD-CLASS STARTUP PITCH COACH AND PITCH DESIGNER.
+Read the participant's Q&A responses (see DYNAMIC CONTEXT at the end), deeply understand their IDEA, and produce the whole single-slide pitch in one pass.
+
+=== PART 1: NARRATIVE ===
+1. **VISIONARY HOOK**: ONE single, high-impact sentence (MAX 12 words). Provocative and confident.
+2. **CUSTOMER PITCH**: 2-3 EXTREMELY SHORT bullet points (MAX 10 words per point). Zero jargon, outcome-focused, punchy. Separate points with bullets (•) or new lines.
+
+=== PART 2: VISUAL ===
+Design a SINGLE-SLIDE VISUAL PITCH whose layout EMERGES from the idea:
+- JOURNEY or PROCESS → flowing path, timeline, or progression
+- PLATFORM or ECOSYSTEM → hub-and-spoke, modular grid, or interconnected nodes
+- IMPACT or OUTCOMES → hero metric surrounded by supporting evidence
+- SYSTEM or ARCHITECTURE → layered stacks, pipelines, or component diagrams
+- COMPARISON or TRANSFORMATION → before/after, contrast panels
+- EXPLORATORY or MULTI-FACETED → dashboard or card-based layout
+DO NOT default to a 3-column "Problem-Solution-Outcome" layout unless the idea genuinely fits it.
+The image prompt must include SPECIFIC details from the Q&A (names, metrics, features), show the solution in action with realistic UI or system elements, include human elements, and use the BRAND COLORS as the dominant theme.
+
+VISUAL STYLE (Non-Negotiable): 16:9 widescreen presentation slide; light-mode, bright white or soft cream background; calm, modern, professional; clean readable headlines and metric callouts. AVOID dark themes, clutter, generic stock imagery.
+
+=== OUTPUT FORMAT ===
+Return ONLY a JSON object, with "image_prompt" first:
+{
+    "image_prompt": {
+        "idea_interpretation": "1-2 sentences describing the core idea",
+        "chosen_layout": "The layout type you chose",
+        "layout_rationale": "Why this layout fits the idea",
+        "final_combined_prompt": "The complete, detailed image generation prompt (layout, content, colors, style, 16:9 format, light-mode background, 8K quality)"
+    },
+    "visionary_hook": "...",
+    "customer_pitch": "..."
+}
+""".strip()
+
+
+_FUSED_PITCH_SKELETON = _prompt_skeleton(_FUSED_PITCH_HEADER, """
+=== PARTICIPANT'S IDEA (Q&A Responses) ===
+{raw_qa_context}
+
+=== CONTEXT ===
+Product/Concept: "{usecase_title}"
+Domain: {usecase_domain}
+Target Audience: {target_market}
+Brand Mood: {theme_mood}
+Visual Style Guide: {theme_style}
+
+=== BRAND COLORS (Must Use) ===
+{brand_colors}
+""")
+
+
+def generate_pitch_narrative(
+    usecase: Dict[str, Any],
+    all_phases_data: Dict[str, Any],
+    use_cache: bool = True,
+    phase_summaries: list = None,
+    context: Optional[_PromptContext] = None,
+    cache_scope: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Generate the text component of the final pitch (Hook + Narrative) 
+    based on the full Q&A context.
+    Identical inputs are served from the response cache, and near-identical Q&A from the
+    semantic cache, when those are enabled. As with apply_customer_filter, the semantic
+    cache needs a `cache_scope` (e.g. the session id).
+    """
+    prompt, usecase_title = _build_pitch_narrative_prompt(
+        usecase, all_phases_data, phase_summaries=phase_summaries, context=context
+    )
+    # Only the Q&A block varies between calls; compare on that, not the fixed instructions
+    use_semantic = use_cache and bool(cache_scope) and semantic_cache.is_enabled()
+    namespace = f"narrative:{cache_scope}:{usecase.get('id') or usecase_title}"
+    dynamic_context = prompt.rpartition(_DYNAMIC_CONTEXT_SEPARATOR)[2]
+    if use_semantic:
+        cached = semantic_cache.get(namespace, dynamic_context)
+        if cached is not None:
+            logger.debug("♻️ Pitch narrative served from semantic cache")
+            return dict(cached)
+
     # Use Claude Sonnet 4.5 for creative narrative generation
     client = get_creative_client()
     try:
-        response_text, _ = client.generate_content(prompt=prompt, temperature=0.7)
-        
-        from backend.models.ai_responses import PitchNarrative, parse_ai_response
-        parsed = parse_ai_response(response_text, PitchNarrative)
+        response_text, usage = _cached_generate(
+            client, prompt, temperature=0.7, use_cache=use_cache, latency="optimized"
+        )
         
-        return {
-            "visionary_hook": parsed.visionary_hook,
-            "customer_pitch": parsed.customer_pitch
-        }
+        narrative = _parse_pitch_narrative(response_text)
+        if use_semantic:
+            semantic_cache.set(namespace, dynamic_context, narrative)
+        return dict(narrative)
 
     except Exception as e:
         logger.error(f"Pitch Narrative Generation Error: {e}")
-        return {
-            "visionary_hook": f"{usecase_title}: The Future is Here.",
-            "customer_pitch": "Leveraging advanced insights to deliver unparalleled value."
-        }
+        return _narrative_fallback(usecase_title)
+
+
+def _build_pitch_narrative_prompt(
+    usecase: Dict[str, Any],
+    all_phases_data: Dict[str, Any],
+    phase_summaries: list = None,
+    context: Optional[_PromptContext] = None
+) -> Tuple[str, str]:
+    """Build the narrative prompt. Returns (prompt, usecase_title)."""
+    if context is not None:
+        phase_summaries = context.fitted_summaries
+    else:
+        if phase_summaries is None:
+            phase_summaries = _extract_phase_summaries(all_phases_data)
+        phase_summaries = _fit_phase_budget(phase_summaries, settings.CURATOR_CONTEXT_BUDGET)
+    
+    # Build full context
+    all_answers_context = "".join([
+        f"=== {phase} ===\n{content}\n\n"
+        for phase, content in phase_summaries
+        if content
+    ])
+
+    usecase_title = usecase.get('title', 'Product')
+    
+    prompt = _NARRATIVE_SKELETON.format_map({
+        "usecase_title": usecase_title,
+        "all_answers_context": all_answers_context,
+    })
+    return prompt, usecase_title
+
+
+def _parse_pitch_narrative(response_text: str) -> Dict[str, str]:
+    """
+    Parse the narrative JSON reply into hook + pitch.
+    Well-formed replies are decoded and validated directly; parse_ai_response's repair
+    pass only runs when that fails.
+    """
+    try:
+        parsed = PitchNarrative.model_validate(_first_json_object(response_text))
+    except ValueError:  # malformed JSON, no object, or a pydantic ValidationError
+        parsed = parse_ai_response(response_text, PitchNarrative)
+    
+    return {
+        "visionary_hook": parsed.visionary_hook,
+        "customer_pitch": parsed.customer_pitch
+    }
+
+
+def _narrative_fallback(usecase_title: str) -> Dict[str, str]:
+    """Static narrative used when generation fails."""
+    return {
+        "visionary_hook": f"{usecase_title}: The Future is Here.",
+        "customer_pitch": "Leveraging advanced insights to deliver unparalleled value."
+    }
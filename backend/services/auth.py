@@ -5,6 +5,7 @@ Handles Keycloak SSO authentication and team code validation.
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 from fastapi import HTTPException, Security
@@ -43,17 +44,28 @@ class UserInfo(BaseModel):
 # =============================================================================
 
 def load_team_codes() -> Dict[str, Dict[str, str]]:
-    """Load team codes from vault JSON file."""
+    """
+    Load team codes from vault JSON file, keyed by upper-cased code.
+    The parsed file is memoized per mtime, so edits are picked up without a restart.
+    """
     team_codes_path = Path(settings.BACKEND_DIR) / "vault" / "team_codes.json"
     
-    if not team_codes_path.exists():
+    try:
+        mtime_ns = team_codes_path.stat().st_mtime_ns
+    except OSError:
         logger.warning(f"Team codes file not found at {team_codes_path}")
         return {}
     
+    return _load_team_codes_cached(str(team_codes_path), mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_team_codes_cached(path_str: str, mtime_ns: int) -> Dict[str, Dict[str, str]]:
+    """Parse team_codes.json; the mtime argument invalidates the entry when the file is edited."""
     try:
-        with open(team_codes_path, 'r') as f:
+        with open(path_str, 'r') as f:
             data = json.load(f)
-            return data.get("team_codes", {})
+        return {code.upper().strip(): info for code, info in data.get("team_codes", {}).items()}
     except Exception as e:
         logger.error(f"Error loading team codes: {e}")
         return {}
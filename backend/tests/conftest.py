@@ -0,0 +1,54 @@
+"""
+Shared fixtures for the AI service unit tests.
+"""
+
+import threading
+import time
+
+import pytest
+
+from backend.config import settings
+from backend.services.ai import response_cache
+
+
+class CountingClient:
+    """Stand-in for ClaudeClient that records prompts and numbers its replies."""
+
+    model_id = "test-model"
+
+    def __init__(self):
+        self.prompts = []
+        self.delay = 0.0
+        self.stream_chunks = ["reply"]
+        self._lock = threading.Lock()
+
+    @property
+    def calls(self) -> int:
+        return len(self.prompts)
+
+    def generate_content(self, prompt, system_prompt=None, temperature=0.7, **kwargs):
+        with self._lock:
+            self.prompts.append(prompt)
+            number = len(self.prompts)
+        time.sleep(self.delay)
+        return f"reply {number}", {"input_tokens": 10, "output_tokens": 5}
+
+    def generate_content_stream(self, prompt, **kwargs):
+        with self._lock:
+            self.prompts.append(prompt)
+        yield from self.stream_chunks
+
+
+@pytest.fixture
+def counting_client():
+    """A fresh CountingClient."""
+    return CountingClient()
+
+
+@pytest.fixture
+def response_cache_enabled(monkeypatch):
+    """Switch the response cache on for one test, starting and ending with it empty."""
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+    response_cache.clear()
+    yield
+    response_cache.clear()
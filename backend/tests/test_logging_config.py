@@ -0,0 +1,45 @@
+"""
+Logging Configuration Unit Tests
+Tests that application loggers reach the queued output handler.
+"""
+
+import logging
+import logging.handlers
+
+import pytest
+
+from backend.utils import logging_config  # noqa: F401  (configures logging on import)
+
+
+@pytest.fixture
+def queued_records(monkeypatch):
+    """Capture records as they are handed to the pitchsync queue handler."""
+    handlers = [
+        h for h in logging.getLogger("pitchsync").handlers
+        if isinstance(h, logging.handlers.QueueHandler)
+    ]
+    assert handlers, "pitchsync logger has no queue handler"
+    records = []
+    monkeypatch.setattr(handlers[0], "enqueue", records.append)
+    return records
+
+
+class TestAppLoggers:
+    """Tests for routing of the pitchsync logger hierarchy."""
+
+    def test_api_info_reaches_queue_handler(self, queued_records):
+        """Lifecycle INFO lines from the API routes are not dropped."""
+        logging.getLogger("pitchsync.api").info("session created")
+
+        assert [(r.name, r.getMessage()) for r in queued_records] == [("pitchsync.api", "session created")]
+
+    def test_image_progress_and_failures_reach_queue_handler(self, queued_records):
+        """Image generation progress and failure lines go through the same queue."""
+        image_logger = logging.getLogger("pitchsync.image")
+        image_logger.info("Image generated")
+        image_logger.error("Flux error")
+
+        assert [(r.name, r.levelno) for r in queued_records] == [
+            ("pitchsync.image", logging.INFO),
+            ("pitchsync.image", logging.ERROR),
+        ]
@@ -0,0 +1,132 @@
+"""
+Response Cache Unit Tests
+Tests for the exact-match LLM response cache.
+"""
+
+import threading
+
+import pytest
+
+from backend.config import settings
+from backend.services.ai import response_cache
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Start every test with an empty cache."""
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
+
+class TestResponseCache:
+    """Tests for key derivation and LRU storage."""
+
+    def test_key_is_stable_and_input_sensitive(self):
+        """Identical inputs share a key; any differing field changes it."""
+        key = response_cache.make_key("prompt", "system", 0.7)
+        assert key == response_cache.make_key("prompt", "system", 0.7)
+        assert key != response_cache.make_key("prompt", "system", 0.8)
+        assert key != response_cache.make_key("prompt", None, 0.7)
+        assert key != response_cache.make_key("prompt!", "system", 0.7)
+        assert key != response_cache.make_key("prompt", "system", 0.7, model_id="other-model")
+
+    def test_key_covers_output_budget_and_tool(self):
+        """Calls differing only in max_tokens or the forced tool never share an entry."""
+        tool = {"name": "curate", "input_schema": {"type": "object"}}
+        key = response_cache.make_key("prompt", None, 0.7, max_tokens=1000, tool=tool)
+        assert key == response_cache.make_key("prompt", None, 0.7, max_tokens=1000, tool=dict(tool))
+        assert key != response_cache.make_key("prompt", None, 0.7, max_tokens=500, tool=tool)
+        assert key != response_cache.make_key("prompt", None, 0.7, max_tokens=1000)
+
+    def test_round_trip(self):
+        """Stored values are returned on a hit and None on a miss."""
+        usage = {"input_tokens": 10, "output_tokens": 5}
+        response_cache.store("k", ("text", usage))
+        assert response_cache.lookup("k") == ("text", usage)
+        assert response_cache.lookup("missing") is None
+
+    def test_lru_eviction(self, monkeypatch):
+        """The least recently used entry is evicted once the cap is reached."""
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_MAX_ENTRIES", 2)
+        response_cache.store("a", 1)
+        response_cache.store("b", 2)
+        response_cache.lookup("a")  # "b" is now the oldest
+        response_cache.store("c", 3)
+        assert response_cache.lookup("a") == 1
+        assert response_cache.lookup("b") is None
+        assert response_cache.lookup("c") == 3
+
+    def test_expired_entries_miss(self, monkeypatch):
+        """Entries older than the TTL are dropped on read; a TTL of 0 never expires."""
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_TTL_SECONDS", 60)
+        now = [1000.0]
+        monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+        response_cache.store("k", 1)
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_TTL_SECONDS", 0)
+        response_cache.store("forever", 2)
+        now[0] += 61
+        assert response_cache.lookup("k") is None
+        assert response_cache.lookup("forever") == 2
+
+
+class TestCachedGenerate:
+    """Tests for the synthesizer's cached LLM call helper."""
+
+    def test_hit_skips_client_and_reports_zero_usage(self, counting_client, response_cache_enabled):
+        """A repeated call is served from cache without spending tokens."""
+        from backend.services.ai.synthesizer import _cached_generate
+
+        assert _cached_generate(counting_client, "p") == ("reply 1", {"input_tokens": 10, "output_tokens": 5})
+        assert _cached_generate(counting_client, "p") == ("reply 1", {"input_tokens": 0, "output_tokens": 0})
+        assert counting_client.calls == 1
+
+    def test_hot_or_opted_out_calls_bypass_cache(self, counting_client, response_cache_enabled):
+        """Calls above the temperature cap or with use_cache=False always reach the client."""
+        from backend.services.ai.synthesizer import _cached_generate
+
+        _cached_generate(counting_client, "p", temperature=1.0)
+        _cached_generate(counting_client, "p", temperature=1.0)
+        _cached_generate(counting_client, "q", use_cache=False)
+        _cached_generate(counting_client, "q", use_cache=False)
+        assert counting_client.calls == 4
+
+    def test_tool_call_never_served_a_plain_reply(self, counting_client, response_cache_enabled):
+        """A tool-forced call with its own output budget misses a cached plain-text reply."""
+        from backend.services.ai.synthesizer import _cached_generate
+
+        _cached_generate(counting_client, "p")
+        _cached_generate(counting_client, "p", max_tokens=1000, tool={"name": "curate"})
+        assert counting_client.calls == 2
+
+    def test_concurrent_identical_calls_are_coalesced(self, counting_client, response_cache_enabled):
+        """Identical in-flight cacheable calls share one model call."""
+        from backend.services.ai.synthesizer import _cached_generate
+
+        counting_client.delay = 0.2
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(_cached_generate(counting_client, "p")))
+            for _ in range(3)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert counting_client.calls == 1
+        assert {text for text, _ in results} == {"reply 1"}
+        assert sorted(usage["input_tokens"] for _, usage in results) == [0, 0, 10]
+
+    def test_no_coalescing_with_cache_disabled(self, counting_client):
+        """With the response cache off, concurrent identical calls each reach the model."""
+        from backend.services.ai.synthesizer import _cached_generate
+
+        counting_client.delay = 0.1
+        threads = [threading.Thread(target=_cached_generate, args=(counting_client, "p")) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert counting_client.calls == 3
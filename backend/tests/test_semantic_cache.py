@@ -0,0 +1,90 @@
+"""
+Semantic Cache Unit Tests
+Tests for the near-duplicate LLM response cache.
+"""
+
+import pytest
+
+from backend.services.ai import semantic_cache
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Start every test with an empty cache."""
+    semantic_cache.clear()
+    yield
+    semantic_cache.clear()
+
+
+class TestSemanticCache:
+    """Tests for similarity scoring and namespaced lookup."""
+
+    def test_similarity_bounds(self):
+        """Identical texts score 1, disjoint texts score 0."""
+        assert semantic_cache.similarity("Fast onboarding for teams", "fast onboarding for teams") == pytest.approx(1.0)
+        assert semantic_cache.similarity("alpha beta", "gamma delta") == 0.0
+        assert semantic_cache.similarity("", "anything") == 0.0
+
+    def test_near_duplicate_hit(self):
+        """A small wording change still hits; an unrelated text misses."""
+        text = "Our bot resolves support tickets automatically using the CRM history of every customer account " * 3
+        semantic_cache.set("filter:bot", text, "cached pitch")
+        assert semantic_cache.get("filter:bot", text + " today") == "cached pitch"
+        assert semantic_cache.get("filter:bot", "Route trucks around construction sites") is None
+
+    def test_namespaces_are_isolated(self):
+        """Entries never leak across namespaces."""
+        semantic_cache.set("filter:bot", "same text", "filter reply")
+        assert semantic_cache.get("narrative:bot", "same text") is None
+
+    def test_number_or_negation_edits_miss(self):
+        """Edits that flip a number or a negation are never served the stale reply."""
+        text = (
+            "Our platform will NOT store customer data in the EU and costs 50 dollars per seat, "
+            "with onboarding, analytics, audit trails and support included for every team. "
+        ) * 2
+        semantic_cache.set("filter:s1:bot", text, "cached pitch")
+        assert semantic_cache.get("filter:s1:bot", text.replace("NOT store", "store")) is None
+        assert semantic_cache.get("filter:s1:bot", text.replace("50 dollars", "500 dollars")) is None
+        assert semantic_cache.get("filter:s1:bot", text + " today") == "cached pitch"
+
+    def test_swapped_word_misses(self):
+        """A long text that clears the cosine threshold still misses when a word is swapped."""
+        text = "Our bot resolves support tickets automatically using the CRM history of every customer account " * 3
+        semantic_cache.set("filter:s1:bot", text, "cached pitch")
+        edited = text.replace("CRM", "ERP", 1)
+
+        assert semantic_cache.similarity(text, edited) >= 0.95
+        assert semantic_cache.get("filter:s1:bot", edited) is None
+
+    def test_least_recently_used_namespace_is_dropped(self, monkeypatch):
+        """The number of namespaces is bounded; reading a namespace keeps it alive."""
+        from backend.config import settings
+
+        monkeypatch.setattr(settings, "SEMANTIC_CACHE_MAX_NAMESPACES", 2)
+        semantic_cache.set("filter:s1:bot", "same text", "s1 reply")
+        semantic_cache.set("filter:s2:bot", "same text", "s2 reply")
+        assert semantic_cache.get("filter:s1:bot", "same text") == "s1 reply"
+        semantic_cache.set("filter:s3:bot", "same text", "s3 reply")
+
+        assert semantic_cache.get("filter:s2:bot", "same text") is None
+        assert semantic_cache.get("filter:s1:bot", "same text") == "s1 reply"
+        assert semantic_cache.get("filter:s3:bot", "same text") == "s3 reply"
+
+
+class TestCustomerFilterScope:
+    """Tests for how the customer filter namespaces its semantic cache entries."""
+
+    def test_rewrites_never_cross_sessions(self, counting_client, monkeypatch):
+        """Two sessions on the same usecase each get their own rewrite; unscoped calls skip the cache."""
+        from backend.config import settings
+        from backend.services.ai import synthesizer
+
+        monkeypatch.setattr(settings, "SEMANTIC_CACHE_ENABLED", True)
+        monkeypatch.setattr(synthesizer, "get_client", lambda: counting_client)
+        usecase = {"id": "shared_usecase"}
+
+        assert synthesizer.apply_customer_filter("Same concept", usecase, cache_scope="team-a") == "reply 1"
+        assert synthesizer.apply_customer_filter("Same concept", usecase, cache_scope="team-a") == "reply 1"
+        assert synthesizer.apply_customer_filter("Same concept", usecase, cache_scope="team-b") == "reply 2"
+        assert synthesizer.apply_customer_filter("Same concept", usecase) == "reply 3"
@@ -0,0 +1,527 @@
+"""
+Synthesizer Unit Tests
+Tests for the prompt-building helpers that run without calling Claude.
+"""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from backend.services.ai import synthesizer
+
+
+class TestBrandColors:
+    """Tests for brand color extraction."""
+
+    def test_vault_theme_takes_priority(self):
+        """A usecase with a vault theme.json uses its palette."""
+        colors = synthesizer._load_brand_colors({"id": "ai_support_bot"}, {"colors": {"primary": "#000000"}})
+        assert colors.startswith("Primary: #2563EB | Secondary: #004792 | Background: #F8FAFC")
+
+    def test_theme_object_fallback(self):
+        """Without a vault theme the passed theme's colors are used, skipping empty keys."""
+        theme = {"colors": {"primary": "#111111", "bg": "#FFFFFF", "error": ""}}
+        colors = synthesizer._load_brand_colors({"id": "does_not_exist"}, theme)
+        assert colors == "Primary: #111111 | Background: #FFFFFF"
+
+    def test_memoized_until_theme_file_changes(self, tmp_path, monkeypatch):
+        """A cached palette is reused until the vault theme.json mtime moves."""
+        monkeypatch.setattr(synthesizer, "VAULT_ROOT", tmp_path)
+        synthesizer._load_brand_colors_cached.cache_clear()
+        theme_file = tmp_path / "bot" / "theme.json"
+        theme_file.parent.mkdir()
+        theme_file.write_text('{"colors": {"primary": "#111111"}}')
+        assert synthesizer._load_brand_colors({"id": "bot"}) == "Primary: #111111"
+
+        theme_file.write_text('{"colors": {"primary": "#222222"}}')
+        stat = theme_file.stat()
+        os.utime(theme_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert synthesizer._load_brand_colors({"id": "bot"}) == "Primary: #222222"
+
+    def test_default_palette(self):
+        """With nothing to go on the default palette is returned."""
+        assert "Teal" in synthesizer._load_brand_colors()
+
+    def test_default_brand_colors_constant(self):
+        """The module-level constant is the fallback palette, with no file access."""
+        from backend.services.ai.synthesizer import DEFAULT_BRAND_COLORS
+
+        assert DEFAULT_BRAND_COLORS == synthesizer._load_brand_colors({"id": "no-such-usecase"})
+        assert "Teal" in DEFAULT_BRAND_COLORS
+
+
+class TestPhaseSummaries:
+    """Tests for Q&A context extraction."""
+
+    def test_object_and_dict_responses(self):
+        """Model objects and raw dicts produce the same Q&A text; unanswered phases are skipped."""
+        from backend.models.session import PhaseData, PhaseResponse
+
+        phases = {
+            "Phase 1": PhaseData(responses=[PhaseResponse(q="Who?", a="Ops teams")]),
+            "Phase 2": {"responses": [{"q": "Why?", "a": "Speed"}, {"a": "No question"}]},
+            "Phase 3": {"responses": []},
+            "Phase 4": PhaseData(),
+        }
+        summaries = synthesizer._extract_phase_summaries(phases)
+        assert summaries == [
+            ("Phase 1", "Q: Who?\nA: Ops teams"),
+            ("Phase 2", "Q: Why?\nA: Speed\n\nQ: Question\nA: No question"),
+        ]
+
+    def test_budget_is_shared_across_phases(self):
+        """Short phases are untouched; long ones keep their head within the budget."""
+        phases = [
+            ("Short", "a" * 10),
+            ("Long 1", "b" * 100),
+            ("Long 2", "c" * 100),
+        ]
+        fitted = synthesizer._fit_phase_budget(phases, max_tokens=20)  # 80 chars
+        assert fitted[0] == ("Short", "a" * 10)
+        assert fitted[1][1].startswith("b" * 35) and fitted[1][1].endswith("[...truncated]")
+        assert fitted[2][1].startswith("c" * 35)
+        assert synthesizer._fit_phase_budget(phases, max_tokens=1000) is phases
+
+
+class TestSlimUsecase:
+    """Tests for the usecase projection sent to the customer filter."""
+
+    def test_drops_non_narrative_fields(self):
+        """Only copywriting fields survive, in a stable order."""
+        usecase = {
+            "id": "ai_support_bot",
+            "title": "AI Support Bot",
+            "complexity": "Medium",
+            "theme_id": "modern_sleek",
+            "domain": "Customer Service",
+        }
+        assert synthesizer._slim_usecase(usecase) == {"title": "AI Support Bot", "domain": "Customer Service"}
+
+    def test_json_is_memoized_on_field_values(self):
+        """Equal usecases share one serialized form; unhashable values still serialize."""
+        first = synthesizer._usecase_json({"id": "a", "title": "Bot", "domain": "Ops"})
+        assert first == '{"title":"Bot","domain":"Ops"}'
+        assert synthesizer._usecase_json({"id": "b", "title": "Bot", "domain": "Ops"}) is first
+        assert synthesizer._usecase_json({"title": "Bot", "target_market": ["SMB"]}) == '{"title":"Bot","target_market":["SMB"]}'
+
+
+class TestCuratorRecolour:
+    """Tests for serving palette-only changes from the curator cache."""
+
+    def test_hex_codes_are_remapped_by_label(self):
+        """Each old hex code is swapped for the new colour with the same label."""
+        struct = {"final_combined_prompt": "Slide in #111111 with #222222 accents", "chosen_layout": "Hero"}
+        recoloured = synthesizer._remap_brand_colors(
+            struct,
+            "Primary: #111111 | Secondary: #222222",
+            "Primary: #AAAAAA | Secondary: #222222",
+        )
+        assert recoloured["final_combined_prompt"] == "Slide in #AAAAAA with #222222 accents"
+        assert recoloured["chosen_layout"] == "Hero"
+
+    def test_unmappable_palette_falls_back(self):
+        """No shortcut when the cached prompt never used the old colours."""
+        struct = {"final_combined_prompt": "Slide in teal"}
+        assert synthesizer._remap_brand_colors(struct, "Primary: #111111", "Primary: #AAAAAA") is None
+
+
+class TestClampImagePrompt:
+    """Tests for the 16:9 / 8K / light-mode safety clamps."""
+
+    def test_missing_specs_are_added(self):
+        """A bare prompt gains the aspect ratio, resolution and light-mode clauses."""
+        clamped = synthesizer._clamp_image_prompt("Hero slide")
+        assert clamped.startswith("16:9 widescreen aspect ratio, Hero slide")
+        assert "8K resolution" in clamped and clamped.endswith("high-key lighting")
+
+    def test_present_specs_are_left_alone(self):
+        """Markers are matched case-insensitively; a dark theme still gets the light-mode clause."""
+        prompt = "16X9 slide, 8K, Lighting soft"
+        assert synthesizer._clamp_image_prompt(prompt) == prompt
+        assert synthesizer._clamp_image_prompt(prompt + ", dark").endswith("high-key lighting")
+
+
+class TestPromptLayout:
+    """Tests for the static-prefix / dynamic-tail prompt layout."""
+
+    def test_draft_and_filter_prompts_end_with_the_request_data(self):
+        """Per-request data only appears after the byte-identical static header."""
+        phases = {"Phase 1": {"responses": [{"q": "Who?", "a": "Ops"}]}}
+        draft = synthesizer._build_draft_prompt({"title": "Bot"}, phases)
+        _, filter_prompt = synthesizer._build_customer_filter_prompt("Tickets resolve themselves", {"title": "Bot"})
+
+        for prompt, header, data in (
+            (draft, synthesizer._DRAFT_MASTER_HEADER, "Ops"),
+            (filter_prompt, synthesizer._CUSTOMER_FILTER_HEADER, "Tickets resolve themselves"),
+        ):
+            static, _, dynamic = prompt.partition(synthesizer._DYNAMIC_CONTEXT_SEPARATOR)
+            assert static == header
+            assert data in dynamic
+
+
+class TestJsonDecoding:
+    """Tests for the JSON encode and decode helpers."""
+
+    def test_accepts_bytes_and_raw_control_characters(self):
+        """Model replies with literal newlines inside strings still decode."""
+        assert synthesizer._loads(b'{"a": 1}') == {"a": 1}
+        assert synthesizer._loads('{"prompt": "line one\nline two"}') == {"prompt": "line one\nline two"}
+
+    def test_pretty_dump_round_trips(self):
+        """Frontend manifests are indented and decode back to the same struct."""
+        struct = {"final_combined_prompt": "Café slide", "panels": [1, 2]}
+        dumped = synthesizer._dumps_pretty(struct)
+        assert '\n  "final_combined_prompt"' in dumped
+        assert json.loads(dumped) == struct
+
+    def test_first_object_ignores_surrounding_prose(self):
+        """The reply's first object decodes even with fences or trailing braces after it."""
+        reply = 'Sure:\n```json\n{"final_combined_prompt": "Hub {x}"}\n```\nNote: {not json}'
+        assert synthesizer._first_json_object(reply) == {"final_combined_prompt": "Hub {x}"}
+        assert synthesizer._first_json_object("no json here") is None
+
+    def test_narrative_parse_fast_path_and_repair(self):
+        """Clean replies validate directly; trailing commas still go through the repair pass."""
+        clean = 'Here:\n{"visionary_hook": "Hook", "customer_pitch": "Pitch"}'
+        broken = '{"visionary_hook": "Hook", "customer_pitch": "Pitch",}'
+        expected = {"visionary_hook": "Hook", "customer_pitch": "Pitch"}
+        assert synthesizer._parse_pitch_narrative(clean) == expected
+        assert synthesizer._parse_pitch_narrative(broken) == expected
+
+
+class _RecordingClient:
+    """Stand-in for ClaudeClient that records prompts and replies with a fixed struct."""
+
+    def __init__(self):
+        self.prompts = []
+        self.tools = []
+
+    def generate_content(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        self.tools.append(kwargs.get("tool"))
+        reply = {"final_combined_prompt": f"16:9 light slide v{len(self.prompts)}, 8K"}
+        return json.dumps(reply), {"input_tokens": 1, "output_tokens": 1}
+
+
+class TestCuratorStructuralCache:
+    """Tests for reusing curated structs across palette and notes changes."""
+
+    @pytest.fixture(autouse=True)
+    def client(self, monkeypatch):
+        synthesizer._curator_cache.clear()
+        client = _RecordingClient()
+        monkeypatch.setattr(synthesizer, "get_creative_client", lambda: client)
+        yield client
+        synthesizer._curator_cache.clear()
+
+    def test_notes_only_change_uses_delta_refinement(self, client, response_cache_enabled):
+        """A new refinement note is applied to the cached struct with the short, tool-forced prompt."""
+        usecase = {"id": "does_not_exist", "title": "Bot"}
+        phases = {"Phase 1": {"responses": [{"q": "Who?", "a": "Ops"}]}}
+        synthesizer.generate_customer_image_prompt(usecase, phases, {})
+        struct, _ = synthesizer.generate_customer_image_prompt(usecase, phases, {}, additional_notes="Add a robot")
+
+        assert len(client.prompts) == 2
+        assert client.prompts[1].startswith(synthesizer._DELTA_REFINEMENT_HEADER)
+        assert "Add a robot" in client.prompts[1]
+        assert client.tools[1] is synthesizer._CURATOR_TOOL
+        assert struct["final_combined_prompt"].startswith("16:9 light slide v2")
+
+    def test_successive_notes_refine_the_base_struct(self, client, response_cache_enabled):
+        """A second note replaces the first: both refinements start from the no-notes struct."""
+        usecase = {"id": "does_not_exist", "title": "Bot"}
+        phases = {"Phase 1": {"responses": [{"q": "Who?", "a": "Ops"}]}}
+        synthesizer.generate_customer_image_prompt(usecase, phases, {})
+        synthesizer.generate_customer_image_prompt(usecase, phases, {}, additional_notes="Add a robot")
+        synthesizer.generate_customer_image_prompt(usecase, phases, {}, additional_notes="Add a dog")
+
+        assert len(client.prompts) == 3
+        assert "16:9 light slide v1" in client.prompts[2]
+        assert "v2" not in client.prompts[2]
+        assert "Add a robot" not in client.prompts[2]
+
+    def test_shortcuts_follow_the_response_cache(self, client):
+        """With the response cache off, repeats and notes changes always run a full curation."""
+        usecase = {"id": "does_not_exist", "title": "Bot"}
+        phases = {"Phase 1": {"responses": [{"q": "Who?", "a": "Ops"}]}}
+        synthesizer.generate_customer_image_prompt(usecase, phases, {})
+        synthesizer.generate_customer_image_prompt(usecase, phases, {})
+        synthesizer.generate_customer_image_prompt(usecase, phases, {}, additional_notes="Add a robot")
+
+        assert len(client.prompts) == 3
+        assert not any(prompt.startswith(synthesizer._DELTA_REFINEMENT_HEADER) for prompt in client.prompts)
+
+    def test_identical_inputs_served_from_structural_cache(self, client, response_cache_enabled):
+        """Unchanged inputs are served from the structural cache once caching is on."""
+        usecase = {"id": "does_not_exist", "title": "Bot"}
+        phases = {"Phase 1": {"responses": [{"q": "Who?", "a": "Ops"}]}}
+        first, _ = synthesizer.generate_customer_image_prompt(usecase, phases, {}, use_cache=False)
+        second, usage = synthesizer.generate_customer_image_prompt(usecase, phases, {})
+
+        assert len(client.prompts) == 1
+        assert second == first
+        assert usage == {"input_tokens": 0, "output_tokens": 0}
+
+    def test_use_cache_false_runs_full_curation(self, client, response_cache_enabled):
+        """Forcing a fresh sample skips the structural shortcuts."""
+        usecase = {"id": "does_not_exist", "title": "Bot"}
+        phases = {"Phase 1": {"responses": [{"q": "Who?", "a": "Ops"}]}}
+        synthesizer.generate_customer_image_prompt(usecase, phases, {})
+        synthesizer.generate_customer_image_prompt(usecase, phases, {}, additional_notes="Bigger", use_cache=False)
+
+        assert not client.prompts[1].startswith(synthesizer._DELTA_REFINEMENT_HEADER)
+
+    def test_concept_without_qa_uses_template(self, client, monkeypatch):
+        """An edited concept with no Q&A skips the model unless the LLM is forced."""
+        monkeypatch.setattr(synthesizer.settings, "TEMPLATE_IMAGE_PROMPT_ENABLED", True)
+        usecase = {"id": "does_not_exist", "title": "Bot"}
+        struct, usage = synthesizer.generate_customer_image_prompt(usecase, {}, {}, additional_notes="Visual Concept: robots")
+
+        assert client.prompts == []
+        assert usage == {"input_tokens": 0, "output_tokens": 0}
+        assert "Visual Concept: robots" in struct["final_combined_prompt"]
+        assert "16:9" in struct["final_combined_prompt"]
+
+        synthesizer.generate_customer_image_prompt(usecase, {}, {}, additional_notes="Visual Concept: robots", force_llm=True)
+        assert len(client.prompts) == 1
+
+    def test_unanswered_phases_use_template(self, client, monkeypatch):
+        """Phases without any responses count as no Q&A for the template short-circuit."""
+        monkeypatch.setattr(synthesizer.settings, "TEMPLATE_IMAGE_PROMPT_ENABLED", True)
+        phases = {"Phase 1": {"responses": []}, "Phase 2": {}}
+        synthesizer.generate_customer_image_prompt({"title": "Bot"}, phases, {}, additional_notes="robots")
+        assert client.prompts == []
+
+    def test_blank_answers_use_template(self, client, monkeypatch):
+        """Questions with blank or whitespace answers count as no Q&A; one real answer uses the curator."""
+        monkeypatch.setattr(synthesizer.settings, "TEMPLATE_IMAGE_PROMPT_ENABLED", True)
+        phases = {"Phase 1": {"responses": [{"q": "Who?", "a": ""}, {"q": "Why?", "a": "  \n"}]}}
+        synthesizer.generate_customer_image_prompt({"title": "Bot"}, phases, {}, additional_notes="robots")
+        assert client.prompts == []
+
+        phases["Phase 2"] = {"responses": [{"q": "How?", "a": "Chat"}]}
+        synthesizer.generate_customer_image_prompt({"title": "Bot"}, phases, {}, additional_notes="robots")
+        assert len(client.prompts) == 1
+
+
+class _StreamingClient:
+    """Stand-in for ClaudeClient that streams a fixed reply."""
+
+    def generate_content_stream(self, prompt, **kwargs):
+        yield from ["\n", "Stop ", "waiting. ", "Start shipping."]
+
+
+class TestSynthesizePitchStream:
+    """Tests for the streaming synthesis path."""
+
+    def test_deltas_then_complete(self, monkeypatch):
+        """Pitch deltas arrive first; the final event carries the assembled pitch and assets."""
+        monkeypatch.setattr(synthesizer, "get_client", lambda: _StreamingClient())
+        monkeypatch.setattr(
+            synthesizer, "_render_pitch_assets",
+            lambda usecase, pitch, theme: {"customer_pitch": pitch, "image_url": "/generated/x.png"}
+        )
+        events = list(synthesizer.synthesize_pitch_stream({"id": "bot"}, "edited", {}))
+
+        assert [e["text"] for e in events[:-1]] == ["Stop ", "waiting. ", "Start shipping."]
+        assert events[-1] == {"type": "complete", "customer_pitch": "Stop waiting. Start shipping.", "image_url": "/generated/x.png"}
+
+    def test_draft_stream_yields_deltas(self, monkeypatch):
+        """The draft master prompt streams as text deltas that join to the full draft."""
+        monkeypatch.setattr(synthesizer, "get_client", lambda: _StreamingClient())
+        deltas = list(synthesizer.prepare_master_prompt_draft_stream({"title": "Bot"}, {}))
+        assert "".join(deltas) == "Stop waiting. Start shipping."
+
+    def test_stream_and_blocking_draft_share_cache_entries(self, counting_client, response_cache_enabled, monkeypatch):
+        """A streamed draft is served to the blocking variant from the response cache."""
+        counting_client.stream_chunks = ["\n", "Stop ", "waiting. ", "Start shipping."]
+        monkeypatch.setattr(synthesizer, "get_client", lambda: counting_client)
+        list(synthesizer.prepare_master_prompt_draft_stream({"title": "Bot"}, {}))
+
+        assert synthesizer.prepare_master_prompt_draft({"title": "Bot"}, {}) == "Stop waiting. Start shipping."
+        assert counting_client.calls == 1
+
+
+class TestDeferredImage:
+    """Tests for rendering the pitch image in the background."""
+
+    def test_task_id_returned_and_polled(self, monkeypatch):
+        """defer_image returns a task id whose state resolves to the rendered URL."""
+        from backend.services.ai import image_tasks
+
+        monkeypatch.setattr(image_tasks, "generate_image", lambda prompt, usecase=None: "/generated/late.png")
+        monkeypatch.setattr(
+            synthesizer, "generate_customer_image_prompt",
+            lambda **kwargs: ({"final_combined_prompt": "16:9 slide"}, {})
+        )
+        result = synthesizer._render_pitch_assets({"id": "bot"}, "pitch", {}, defer_image=True)
+
+        assert result["image_url"] == ""
+        for _ in range(100):
+            task = image_tasks.get(result["image_task_id"])
+            if task["status"] != "pending":
+                break
+            time.sleep(0.01)
+        assert task == {"status": "done", "image_url": "/generated/late.png"}
+        assert image_tasks.get("unknown") is None
+
+    def test_on_done_fires_once_rendered(self, monkeypatch):
+        """Callbacks get the URL after the render, or immediately when registered late."""
+        from backend.services.ai import image_tasks
+
+        release = threading.Event()
+        monkeypatch.setattr(
+            image_tasks, "generate_image",
+            lambda prompt, usecase=None: release.wait(timeout=2) and "/generated/late.png"
+        )
+        task_id = image_tasks.submit("16:9 slide")
+        early, late = threading.Event(), []
+        image_tasks.on_done(task_id, lambda url: early.set() if url == "/generated/late.png" else None)
+        release.set()
+
+        assert early.wait(timeout=2)
+        image_tasks.on_done(task_id, late.append)
+        assert late == ["/generated/late.png"]
+
+
+class TestSynthesizePitch:
+    """Tests for the non-streaming synthesis path."""
+
+    def test_curator_runs_alongside_filter(self, monkeypatch):
+        """Without the template, the curator is briefed from the edited prompt, not the filtered pitch."""
+        monkeypatch.setattr(synthesizer.settings, "TEMPLATE_IMAGE_PROMPT_ENABLED", False)
+        monkeypatch.setattr(synthesizer, "apply_customer_filter", lambda content, usecase, cache_scope=None: "filtered pitch")
+        monkeypatch.setattr(synthesizer, "generate_image", lambda prompt, usecase=None: "/generated/x.png")
+        briefs = []
+
+        def curate(usecase, all_phases_data, theme, additional_notes=None):
+            briefs.append(additional_notes)
+            return {"final_combined_prompt": "16:9 slide"}, {}
+
+        monkeypatch.setattr(synthesizer, "generate_customer_image_prompt", curate)
+        result = synthesizer.synthesize_pitch({"id": "bot"}, "edited", {})
+
+        assert briefs == ["Visual Concept: edited"]
+        assert result["customer_pitch"] == "filtered pitch"
+        assert result["image_url"] == "/generated/x.png"
+
+
+class TestAutoGeneratePitch:
+    """Tests for the automated QnA -> pitch pipeline."""
+
+    def test_image_starts_before_narrative_finishes(self, monkeypatch):
+        """The render is submitted once the curator returns, overlapping the narrative call."""
+        image_started = threading.Event()
+
+        def narrative(usecase, all_phases_data, context=None, cache_scope=None):
+            assert image_started.wait(timeout=2)
+            return {"visionary_hook": "Hook", "customer_pitch": "Pitch"}
+
+        def render(prompt, usecase=None):
+            image_started.set()
+            return "/generated/x.png"
+
+        monkeypatch.setattr(
+            synthesizer, "generate_customer_image_prompt",
+            lambda usecase, all_phases_data, theme, context=None: ({"final_combined_prompt": "16:9 slide"}, {})
+        )
+        monkeypatch.setattr(synthesizer, "generate_pitch_narrative", narrative)
+        monkeypatch.setattr(synthesizer, "generate_image", render)
+        result = synthesizer.auto_generate_pitch({"id": "bot"}, {}, {})
+
+        assert result["visionary_hook"] == "Hook"
+        assert result["image_url"] == "/generated/x.png"
+
+    def test_fused_setting_routes_through_single_call(self, monkeypatch):
+        """With FUSED_PITCH_ENABLED the pipeline makes one fused call instead of two."""
+        calls = []
+        monkeypatch.setattr(synthesizer.settings, "FUSED_PITCH_ENABLED", True)
+        monkeypatch.setattr(
+            synthesizer, "synthesize_all_in_one",
+            lambda usecase, all_phases_data, theme, defer_image=False, cache_scope=None: calls.append(usecase) or {"image_url": ""}
+        )
+        monkeypatch.setattr(synthesizer, "generate_pitch_narrative", lambda *a, **k: pytest.fail("split pipeline used"))
+        synthesizer.auto_generate_pitch({"id": "bot"}, {}, {})
+
+        assert calls == [{"id": "bot"}]
+
+
+class _FusedClient(_RecordingClient):
+    """Stand-in for ClaudeClient that streams a fused image prompt + narrative reply."""
+
+    def __init__(self, image_started):
+        super().__init__()
+        self.image_started = image_started
+        self.image_started_mid_stream = False
+
+    def generate_content_stream(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        yield 'Here you go: {"image_prompt": {"chosen_layout": "hub {spokes}", '
+        yield '"final_combined_prompt": "Hub \\"slide\\""}, '
+        self.image_started_mid_stream = self.image_started.wait(timeout=5)
+        yield '"visionary_hook": "Hook", "customer_pitch": "• Fast"}'
+
+
+class TestSynthesizeAllInOne:
+    """Tests for the fused single-call pitch pipeline."""
+
+    def test_image_starts_before_narrative_finishes(self, monkeypatch):
+        """One call yields hook, pitch and a clamped prompt; Flux starts as soon as the prompt closes."""
+        image_started = threading.Event()
+        client = _FusedClient(image_started)
+        monkeypatch.setattr(synthesizer, "get_creative_client", lambda: client)
+
+        def render(prompt, usecase=None):
+            image_started.set()
+            return "/generated/x.png"
+
+        monkeypatch.setattr(synthesizer, "generate_image", render)
+        phases = {"Phase 1": {"responses": [{"q": "Who?", "a": "Ops"}]}}
+        result = synthesizer.synthesize_all_in_one({"id": "does_not_exist", "title": "Bot"}, phases, {}, use_cache=False)
+
+        assert len(client.prompts) == 1
+        assert "Q: Who?\nA: Ops" in client.prompts[0]
+        assert client.image_started_mid_stream
+        assert result["visionary_hook"] == "Hook"
+        assert result["image_url"] == "/generated/x.png"
+        assert json.loads(result["image_prompt"])["final_combined_prompt"].startswith('16:9 widescreen aspect ratio, Hub "slide"')
+
+    def test_broken_reply_keeps_the_started_render(self, monkeypatch):
+        """A stream that fails after the image prompt reuses that render and only regenerates the narrative."""
+
+        class _BreakingStream:
+            def generate_content_stream(self, prompt, **kwargs):
+                yield '{"image_prompt": {"final_combined_prompt": "Hub slide"}, '
+                raise RuntimeError("stream reset")
+
+        renders = []
+        monkeypatch.setattr(synthesizer, "get_creative_client", lambda: _BreakingStream())
+        monkeypatch.setattr(synthesizer, "generate_image", lambda prompt, usecase=None: renders.append(prompt) or "/generated/x.png")
+        monkeypatch.setattr(synthesizer, "generate_customer_image_prompt", lambda *a, **k: pytest.fail("curator re-run"))
+        monkeypatch.setattr(
+            synthesizer, "generate_pitch_narrative",
+            lambda usecase, all_phases_data, use_cache=True, context=None, cache_scope=None: {"visionary_hook": "Hook", "customer_pitch": "Pitch"}
+        )
+        result = synthesizer.synthesize_all_in_one({"id": "does_not_exist", "title": "Bot"}, {}, {}, use_cache=False)
+
+        assert len(renders) == 1
+        assert result["image_url"] == "/generated/x.png"
+        assert result["customer_pitch"] == "Pitch"
+        assert json.loads(result["image_prompt"])["final_combined_prompt"] == renders[0]
+
+    def test_fused_reply_respects_cache_temperature_cap(self, counting_client, response_cache_enabled, monkeypatch):
+        """The fused reply is cached only under the same temperature gate as other calls."""
+        counting_client.stream_chunks = ['{"visionary_hook": "Hook"}']
+        monkeypatch.setattr(synthesizer, "get_creative_client", lambda: counting_client)
+        monkeypatch.setattr(synthesizer.settings, "RESPONSE_CACHE_MAX_TEMPERATURE", 0.5)
+        for _ in range(2):
+            synthesizer._generate_fused_reply("p", True, on_image_prompt=lambda struct: None)
+        assert counting_client.calls == 2
+
+        monkeypatch.setattr(synthesizer.settings, "RESPONSE_CACHE_MAX_TEMPERATURE", 0.8)
+        for _ in range(2):
+            synthesizer._generate_fused_reply("p", True, on_image_prompt=lambda struct: None)
+        assert counting_client.calls == 3
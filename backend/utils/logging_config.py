@@ -5,18 +5,24 @@ Configures structured logging with:
 - Console output with color formatting
 - Log level based on environment
 - Request ID tracking for tracing
+- Non-blocking handlers: records are queued and written to stdout by a
+  background listener thread, so request threads never wait on stdout
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 
 
 _initialized = False
+_listener = None
 
 def setup_logging() -> None:
     """Configure application logging with initialization guard."""
-    global _initialized
+    global _initialized, _listener
     if _initialized:
         return
     _initialized = True
@@ -26,12 +32,25 @@ def setup_logging() -> None:
     # Determine log level
     log_level = logging.DEBUG if settings.DEBUG else logging.INFO
     
+    # The real stdout handler lives behind a queue; callers only pay for an enqueue
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(
+        fmt='%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    # QueueHandler pre-renders the message (and traceback); layout is applied by stream_handler
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
     # Configure root logger with force=True to wipe out any existing handlers (like uvicorn's defaults)
     logging.basicConfig(
-        format='%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
         level=log_level,
-        stream=sys.stdout,
+        handlers=[queue_handler],
         force=True
     )
     
@@ -56,8 +75,10 @@ def setup_logging() -> None:
     for logger_name, level in loggers_config.items():
         lgr = logging.getLogger(logger_name)
         lgr.setLevel(level)
-        # Disable propagation for app loggers to prevent duplicate messages
-        if logger_name.startswith("pitchsync") or logger_name == "backend":
+        # App hierarchies get the queue handler at their top logger; children propagate up to it,
+        # and the top logger stops there so records are not written a second time via root
+        if logger_name in ("pitchsync", "backend"):
+            lgr.addHandler(queue_handler)
             lgr.propagate = False
     
     # Log startup